@@ -1,4 +1,6 @@
 
+pytest_plugins = ["pytest_testtrakt.plugin"]
+
 def pytest_sessionstart():
     print("Starting Tests")
 
@@ -0,0 +1 @@
+"""Pytest plugin for the TestTrakt automator test suites: session pooling, device inventories, tracing, locate benchmarks and record/replay."""
@@ -0,0 +1,87 @@
+import copy
+import time
+
+from pytest_testtrakt.tracing import describe
+
+UNREADABLE = object()
+
+
+def controller_delay(options_request):
+    """The default controller delay set on an OptionsRequest, or None if it does not set one."""
+    for name, value in getattr(options_request, "__dict__", {}).items():
+        if "controller_delay" in name.lower() and value is not None:
+            return value
+    return None
+
+
+class AdaptiveOptions:
+    """Wraps an automator options client so the default controller delay is enforced client-side.
+
+    The delay is taken off the request sent to the server and kept by the
+    pooled automator, where SettlingController uses it as an upper bound.
+    """
+
+    def __init__(self, options, automator):
+        self._options = options
+        self._automator = automator
+
+    def __getattr__(self, name):
+        return getattr(self._options, name)
+
+    def set(self, options_request):
+        delay = controller_delay(options_request)
+        if delay is None:
+            return self._options.set(options_request)
+        self._automator.controller_delay = delay
+        server_request = copy.copy(options_request)
+        server_request.set_default_controller_delay(0)
+        return self._options.set(server_request)
+
+
+class SettlingController:
+    """Wraps an automator controller so a press returns as soon as focus moves.
+
+    With no controller delay set, presses are sent unchanged. Otherwise
+    send_command polls the focused element after the press and returns when it
+    changes, waiting at most the delay. Platforms whose focus cannot be read
+    wait out the full delay, as the server would have. Each wait is recorded
+    as a ``controller.settle`` span.
+    """
+
+    def __init__(self, controller, focused_element, delay, tracer, attributes, poll_interval=100):
+        self._controller = controller
+        self._focused_element = focused_element
+        self._delay = delay
+        self._tracer = tracer
+        self._attributes = attributes
+        self._poll_interval = poll_interval
+
+    def __getattr__(self, name):
+        return getattr(self._controller, name)
+
+    def send_command(self, controller_press):
+        max_delay = self._delay()
+        if not max_delay:
+            return self._controller.send_command(controller_press)
+        attributes = dict(self._attributes, arguments=describe(controller_press), max_delay=max_delay)
+        try:
+            before = self._focused_element()
+        except Exception as error:
+            before = UNREADABLE
+            attributes["focus_error"] = type(error).__name__
+        start = time.perf_counter()
+        result = self._controller.send_command(controller_press)
+        deadline = start + max_delay / 1000.0
+        settled = False
+        while not settled and time.perf_counter() < deadline:
+            time.sleep(min(self._poll_interval / 1000.0, max(0, deadline - time.perf_counter())))
+            if before is UNREADABLE:
+                continue
+            try:
+                settled = self._focused_element() != before
+            except Exception:
+                # nothing is focused halfway through a screen transition
+                settled = False
+        attributes["settled"] = settled
+        self._tracer.record("controller.settle", start, time.perf_counter(), attributes)
+        return result
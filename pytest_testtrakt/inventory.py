@@ -0,0 +1,40 @@
+import json
+import os
+
+
+class DeviceInventory:
+    """Automator endpoints and devices available to each test class.
+
+    The inventory file maps a test class name to a list of devices, each one a
+    set of class attribute overrides, e.g.
+
+        {"Test_RokuTests": [{"ROKU_AUTOMATOR_ADDRESS": "http://farm-1:9070", "ROKU_IP_ADDRESS": "192.168.1.20"},
+                            {"ROKU_AUTOMATOR_ADDRESS": "http://farm-2:9070", "ROKU_IP_ADDRESS": "192.168.1.21"}]}
+
+    Run with pytest-xdist (``-n <devices> --dist loadgroup``) to spread the
+    tests of each class across the devices; xdist hands the next test to
+    whichever worker is free first and worker N always runs against device N.
+    The tests of a class that is not listed all run on one worker, as they
+    share the single device hard-coded in the class.
+    """
+
+    def __init__(self, devices=None):
+        self.devices = devices or {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as inventory_file:
+            return cls(json.load(inventory_file))
+
+    @staticmethod
+    def worker_index():
+        return int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
+
+    def lists(self, test_class):
+        return bool(self.devices.get(test_class.__name__))
+
+    def device_for(self, test_class):
+        devices = self.devices.get(test_class.__name__)
+        if not devices:
+            return {}
+        return devices[self.worker_index() % len(devices)]
@@ -0,0 +1,199 @@
+import bisect
+import enum
+import math
+import random
+import time
+
+from pytest_testtrakt.tracing import describe
+
+
+class LocateTimings:
+    """Time-to-match histogram of every locate call, grouped by locator."""
+
+    BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000, 20000, 40000)
+
+    def __init__(self):
+        self.samples = {}
+        self.samples_by_type = {}
+
+    @staticmethod
+    def label(locator_request):
+        # the timeout is left out so the same locator waited on for different durations is grouped together
+        return describe(locator_request, skip=("timeout",))
+
+    @staticmethod
+    def locator_type(locator_request):
+        # LocatorType.TEXT, RokuLocatorType.XPATH, ... or the request class when no locator type enum is found
+        for value in getattr(locator_request, "__dict__", {}).values():
+            if isinstance(value, enum.Enum):
+                return str(value)
+        return type(locator_request).__name__
+
+    @staticmethod
+    def percentile(ordered, fraction):
+        # nearest rank: the smallest sample with at least ``fraction`` of the samples at or below it
+        return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+    def record(self, locator_request, elapsed_ms, matched):
+        self.samples.setdefault(self.label(locator_request), []).append((elapsed_ms, matched))
+        self.samples_by_type.setdefault(self.locator_type(locator_request), []).append(elapsed_ms)
+
+    def export(self):
+        """The raw samples, in a form xdist can send from a worker to the controller."""
+        return {"samples": self.samples, "samples_by_type": self.samples_by_type}
+
+    def merge(self, exported):
+        for label, samples in exported["samples"].items():
+            self.samples.setdefault(label, []).extend((elapsed_ms, matched) for elapsed_ms, matched in samples)
+        for locator_type, samples in exported["samples_by_type"].items():
+            self.samples_by_type.setdefault(locator_type, []).extend(samples)
+
+    def benchmark(self):
+        results = {}
+        for locator_type, samples in self.samples_by_type.items():
+            ordered = sorted(samples)
+            results[locator_type] = {
+                "calls": len(ordered),
+                "mean": sum(ordered) / len(ordered),
+                "p50": self.percentile(ordered, 0.50),
+                "p95": self.percentile(ordered, 0.95),
+                "p99": self.percentile(ordered, 0.99),
+            }
+        return {"locate": results}
+
+    def regressions(self, baseline, tolerance):
+        regressions = []
+        current = self.benchmark()["locate"]
+        for locator_type, previous in sorted(baseline.get("locate", {}).items()):
+            if locator_type in current and current[locator_type]["p95"] > previous["p95"] * (1 + tolerance):
+                regressions.append("{}: p95 {:.0f}ms, baseline {:.0f}ms".format(locator_type, current[locator_type]["p95"], previous["p95"]))
+        return regressions
+
+    def histogram(self, samples):
+        counts = [0] * (len(self.BUCKETS_MS) + 1)
+        for elapsed_ms, _ in samples:
+            counts[bisect.bisect_left(self.BUCKETS_MS, elapsed_ms)] += 1
+        return counts
+
+    def summary_lines(self):
+        lines = []
+        bucket_names = ["<={}ms".format(bucket) for bucket in self.BUCKETS_MS] + [">{}ms".format(self.BUCKETS_MS[-1])]
+        # slowest locators first
+        for label, samples in sorted(self.samples.items(), key=lambda item: -max(elapsed for elapsed, _ in item[1])):
+            elapsed = sorted(elapsed for elapsed, _ in samples)
+            misses = sum(1 for _, matched in samples if not matched)
+            lines.append("{} calls, {} misses, p50 {:.0f}ms, max {:.0f}ms: {}".format(len(samples), misses, self.percentile(elapsed, 0.50), elapsed[-1], label))
+            lines.append("    " + " ".join("{}:{}".format(name, count) for name, count in zip(bucket_names, self.histogram(samples)) if count))
+        return lines
+
+
+class ElementCollection(list):
+    """The elements returned by a locate call, with spatial queries over their bounding boxes.
+
+    Every query returns a new ElementCollection so queries can be chained,
+    e.g. ``elements.below(header).within(0, 0, 960, 1080).reading_order()``.
+    """
+
+    @classmethod
+    def of(cls, elements):
+        return cls(elements) if isinstance(elements, list) else elements
+
+    def boxes(self):
+        return [(element.get_x(), element.get_y(), element.get_width(), element.get_height()) for element in self]
+
+    def _where(self, predicate):
+        return ElementCollection(element for element, box in zip(self, self.boxes()) if predicate(*box))
+
+    def within(self, x, y, width, height):
+        """Elements whose bounding box lies entirely inside the given rectangle."""
+        return self._where(lambda ex, ey, ew, eh: ex >= x and ey >= y and ex + ew <= x + width and ey + eh <= y + height)
+
+    def left_of(self, element):
+        return self._where(lambda ex, ey, ew, eh: ex + ew <= element.get_x())
+
+    def right_of(self, element):
+        return self._where(lambda ex, ey, ew, eh: ex >= element.get_x() + element.get_width())
+
+    def above(self, element):
+        return self._where(lambda ex, ey, ew, eh: ey + eh <= element.get_y())
+
+    def below(self, element):
+        return self._where(lambda ex, ey, ew, eh: ey >= element.get_y() + element.get_height())
+
+    def with_confidence(self, minimum):
+        return ElementCollection(element for element in self if element.get_confidence() >= minimum)
+
+    def nearest(self, x, y):
+        """The element whose centre is closest to the given point, or None if the collection is empty."""
+        distances = [((ex + ew / 2 - x) ** 2 + (ey + eh / 2 - y) ** 2, index) for index, (ex, ey, ew, eh) in enumerate(self.boxes())]
+        return self[min(distances)[1]] if distances else None
+
+    def reading_order(self):
+        """Elements sorted into lines, top to bottom, and left to right within each line.
+
+        An element joins the current line when its vertical centre falls inside
+        the first element of that line.
+        """
+        ordered = sorted(zip(self.boxes(), self), key=lambda item: item[0][1] + item[0][3] / 2)
+        lines = []
+        for box, element in ordered:
+            if lines and lines[-1][0][0][1] <= box[1] + box[3] / 2 <= lines[-1][0][0][1] + lines[-1][0][0][3]:
+                lines[-1].append((box, element))
+            else:
+                lines.append([(box, element)])
+        return ElementCollection(element for line in lines for _, element in sorted(line, key=lambda item: item[0][0]))
+
+
+# a lost connection or a locator the server cannot parse will not go away by asking again
+FATAL_LOCATE_ERRORS = (OSError, ValueError, TypeError, AttributeError)
+
+
+class TimedLocator:
+    """Wraps an automator locator to record how long each locate call takes to match."""
+
+    def __init__(self, locator, timings):
+        self._locator = locator
+        self._timings = timings
+
+    def __getattr__(self, name):
+        return getattr(self._locator, name)
+
+    def locate(self, locator_request):
+        start = time.monotonic()
+        elements = []
+        try:
+            elements = ElementCollection.of(self._locator.locate(locator_request))
+            return elements
+        finally:
+            self._timings.record(locator_request, (time.monotonic() - start) * 1000, bool(elements))
+
+    def wait_for(self, locator_request, timeout, first_step=250, max_step=5000):
+        """Waits up to ``timeout`` milliseconds for a locator to match.
+
+        Rather than one server-side poll for the whole timeout, the locator is
+        sent with short timeouts that double (with jitter) on every miss, so a
+        quickly rendered element is returned by the first short attempt. Errors
+        are retried until the deadline like misses, except transport and usage
+        errors (FATAL_LOCATE_ERRORS), which are raised straight away.
+        """
+        start = time.monotonic()
+        deadline = start + timeout / 1000.0
+        step = first_step
+        remaining = float(timeout)
+        elements = []
+        try:
+            while True:
+                # rounded up so the last attempt waits until the deadline instead of leaving a sliver for one more call
+                attempt = max(1, math.ceil(min(remaining, random.uniform(step / 2, step))))
+                try:
+                    elements = ElementCollection.of(self._locator.locate(locator_request.with_timeout(attempt)))
+                except Exception as error:
+                    elements = []
+                    if isinstance(error, FATAL_LOCATE_ERRORS) or time.monotonic() >= deadline:
+                        raise
+                if elements or time.monotonic() >= deadline:
+                    return elements
+                remaining = (deadline - time.monotonic()) * 1000
+                step = min(step * 2, max_step)
+        finally:
+            self._timings.record(locator_request, (time.monotonic() - start) * 1000, bool(elements))
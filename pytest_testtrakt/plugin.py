@@ -0,0 +1,157 @@
+"""Pytest hooks and fixtures wiring the automator pool, tracing, benchmarks and replay into a test run."""
+import json
+import os
+
+import pytest
+
+from pytest_testtrakt.inventory import DeviceInventory
+from pytest_testtrakt.locating import LocateTimings
+from pytest_testtrakt.pool import AutomatorPool
+from pytest_testtrakt.replay import AutomatorRecording, RecordingProxies
+from pytest_testtrakt.tracing import Tracer
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("testtrakt")
+    group.addoption("--no-automator-pool", action="store_true", default=False, help="start and quit a fresh automator session for every test")
+    group.addoption("--adaptive-controller-delay", action="store_true", default=False, help="return from each controller press as soon as focus moves, using the default controller delay only as an upper bound")
+    group.addoption("--device-inventory", default=None, help="JSON file listing the automator endpoints and devices for each test class")
+    group.addoption("--trace-export", default=None, help="write a Chrome trace (chrome://tracing, Perfetto) of every automator call to this file")
+    group.addoption("--benchmark-json", default=None, help="write locate call count and mean/p50/p95/p99 latency per locator type to this file")
+    group.addoption("--benchmark-baseline", default=None, help="fail the run if locate p95 latency regressed against this --benchmark-json file")
+    group.addoption("--benchmark-tolerance", type=float, default=0.2, help="allowed p95 slowdown against the baseline, as a fraction (default 0.2)")
+    group.addoption("--automator-record", default=None, help="record the HTTP exchanges of each test with the automator servers into this directory")
+    group.addoption("--automator-replay", default=None, help="answer automator requests from a --automator-record directory instead of real devices")
+    group.addoption("--replay-latency", choices=("zero", "realistic"), default="zero", help="replay responses instantly or after their recorded duration (default zero)")
+
+
+def pytest_configure(config):
+    # registered by pytest-xdist too, but set here so runs without it do not warn about the marker
+    config.addinivalue_line("markers", "xdist_group(name): run all tests of the group on the same xdist worker")
+    path = config.getoption("--device-inventory")
+    config.device_inventory = DeviceInventory.load(path) if path else DeviceInventory()
+    config.locate_timings = LocateTimings()
+    config.benchmark_regressions = []
+
+    record = config.getoption("--automator-record")
+    replay = config.getoption("--automator-replay")
+    if record and replay:
+        raise pytest.UsageError("--automator-record and --automator-replay cannot be used together")
+    config.automator_tracer = Tracer()
+    config.automator_proxies = None
+    if record or replay:
+        recording = AutomatorRecording(record or replay, replay=bool(replay), latency=config.getoption("--replay-latency"))
+        config.automator_proxies = RecordingProxies(recording, config.automator_tracer)
+
+    # each xdist worker is pinned to one device per test class, so never start more workers than devices
+    workers = getattr(config.option, "numprocesses", None)
+    if isinstance(workers, int) and workers > 1 and not hasattr(config, "workerinput"):
+        if getattr(config.option, "dist", None) != "loadgroup":
+            raise pytest.UsageError("running tests on {} workers needs --dist loadgroup, so the tests of each class "
+                                    "without devices in --device-inventory stay on one worker".format(workers))
+        for test_class, devices in config.device_inventory.devices.items():
+            if workers > len(devices):
+                raise pytest.UsageError("{} workers requested but the device inventory only lists {} device(s) for {}".format(workers, len(devices), test_class))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # a class without inventory devices talks to its one hard-coded device, so keep its tests on one xdist worker
+    for item in items:
+        test_class = getattr(item, "cls", None)
+        if test_class is not None and not config.device_inventory.lists(test_class):
+            item.add_marker(pytest.mark.xdist_group(test_class.__name__))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    tracer = item.config.automator_tracer
+    tracer.current_test = item.nodeid
+    yield
+    tracer.current_test = None
+    if item.config.automator_proxies is not None:
+        item.config.automator_proxies.save(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, "rep_" + report.when, report)
+    if report.when == "call":
+        lines = item.config.automator_tracer.summary_lines(item.nodeid)
+        if lines:
+            report.sections.append(("automator trace", "\n".join(lines)))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if config.automator_proxies is not None:
+        config.automator_proxies.close()
+    if config.getoption("--trace-export"):
+        config.automator_tracer.export_chrome_trace(worker_path(config.getoption("--trace-export")))
+    if hasattr(config, "workerinput"):
+        # xdist workers hand their samples to the controller, which writes the benchmark and gates on it
+        config.workeroutput["locate_timings"] = config.locate_timings.export()
+        return
+    if config.getoption("--benchmark-json"):
+        with open(config.getoption("--benchmark-json"), "w") as benchmark_file:
+            json.dump(config.locate_timings.benchmark(), benchmark_file, indent=4, sort_keys=True)
+    if config.getoption("--benchmark-baseline"):
+        with open(config.getoption("--benchmark-baseline")) as baseline_file:
+            baseline = json.load(baseline_file)
+        config.benchmark_regressions = config.locate_timings.regressions(baseline, config.getoption("--benchmark-tolerance"))
+        if config.benchmark_regressions:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    exported = getattr(node, "workeroutput", {}).get("locate_timings")
+    if exported:
+        node.config.locate_timings.merge(exported)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    lines = config.locate_timings.summary_lines()
+    if lines:
+        terminalreporter.section("locate timings")
+        for line in lines:
+            terminalreporter.write_line(line)
+    if config.benchmark_regressions:
+        terminalreporter.section("locate benchmark regressions")
+        for line in config.benchmark_regressions:
+            terminalreporter.write_line(line)
+
+
+def worker_path(path):
+    # each xdist worker writes its own file next to the requested one
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker:
+        return path
+    root, extension = os.path.splitext(path)
+    return "{}.{}{}".format(root, worker, extension)
+
+
+@pytest.fixture(scope="session")
+def automator_sessions(request):
+    config = request.config
+    pool = AutomatorPool(config.locate_timings, config.automator_tracer, enabled=not config.getoption("--no-automator-pool"),
+                         adaptive_controller_delay=config.getoption("--adaptive-controller-delay"))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def automator_pool(request, automator_sessions):
+    if request.instance is not None:
+        for name, value in request.config.device_inventory.device_for(request.cls).items():
+            setattr(request.instance, name, value)
+        # point the automator clients at the recording proxies, after the inventory picked the real servers
+        if request.config.automator_proxies is not None:
+            for name in dir(request.instance):
+                if name.endswith("_AUTOMATOR_ADDRESS"):
+                    setattr(request.instance, name, request.config.automator_proxies.address_for(getattr(request.instance, name)))
+    yield automator_sessions
+    report = getattr(request.node, "rep_call", None)
+    automator_sessions.release(discard=report is None or report.failed)
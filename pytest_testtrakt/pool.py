@@ -0,0 +1,134 @@
+from pytest_testtrakt.controller import AdaptiveOptions, SettlingController
+from pytest_testtrakt.locating import TimedLocator
+from pytest_testtrakt.tracing import TracedClient, describe
+
+
+class StatefulClient:
+    """Wraps an automator sub-client so calls that depend on session history mark the session dirty."""
+
+    def __init__(self, client, stateful_calls, automator):
+        self._client = client
+        self._stateful_calls = stateful_calls
+        self._automator = automator
+
+    def __getattr__(self, name):
+        if name in self._stateful_calls:
+            self._automator.dirty = True
+        return getattr(self._client, name)
+
+
+class PooledAutomator:
+    """Wraps a live automator so the pool can tell whether a test changed its state."""
+
+    # calls that leave the app somewhere other than its launch screen
+    STATEFUL_CALLS = ("run_app_in_background",)
+
+    SUB_CLIENTS = ("display", "options", "system", "web_profiler")
+
+    # sub-client calls whose result depends on everything the session did so far, or that can change the page
+    STATEFUL_SUB_CLIENT_CALLS = {
+        "display": ("get_recording",),
+        "system": ("get_console_logs",),
+        "web_profiler": ("execute_script", "get_console_logs"),
+    }
+
+    FOCUS_SCRIPT = "document.activeElement ? document.activeElement.outerHTML : ''"
+
+    def __init__(self, automator, timings, tracer, attributes, reusable=True, adaptive_controller_delay=False):
+        self._automator = automator
+        self._timings = timings
+        self._tracer = tracer
+        self._attributes = attributes
+        self._adaptive_controller_delay = adaptive_controller_delay
+        self.controller_delay = None
+        self.dirty = not reusable
+
+    def __getattr__(self, name):
+        if name in self.STATEFUL_CALLS:
+            self.dirty = True
+        attribute = getattr(self._automator, name)
+        if name in self.SUB_CLIENTS:
+            return lambda: StatefulClient(TracedClient(attribute(), name, self._tracer, self._attributes), self.STATEFUL_SUB_CLIENT_CALLS.get(name, ()), self)
+        if callable(attribute):
+            return self._tracer.wrap(attribute, name, self._attributes)
+        return attribute
+
+    def locator(self):
+        return TimedLocator(TracedClient(self._automator.locator(), "locator", self._tracer, self._attributes), self._timings)
+
+    def options(self):
+        # options set by one test would otherwise carry over to the next
+        self.dirty = True
+        options = TracedClient(self._automator.options(), "options", self._tracer, self._attributes)
+        return AdaptiveOptions(options, self) if self._adaptive_controller_delay else options
+
+    def controller(self):
+        self.dirty = True
+        controller = TracedClient(self._automator.controller(), "controller", self._tracer, self._attributes)
+        return SettlingController(controller, self.focused_element, lambda: self.controller_delay, self._tracer, self._attributes)
+
+    def focused_element(self):
+        # roku reports its focused scenegraph node, the web platforms are asked through the web profiler
+        if hasattr(self._automator, "get_active_element"):
+            return self.get_active_element().get_element_data()
+        return self.web_profiler().execute_script(self.FOCUS_SCRIPT)
+
+    def quit(self):
+        self._tracer.wrap(self._automator.quit, "quit", self._attributes)()
+
+
+class AutomatorPool:
+    """Keeps automator sessions alive across tests that use the same start request.
+
+    Sessions are keyed by automator class, address and start request, so a test
+    only reuses a session that was launched exactly the way it would have been
+    launched itself. The automators cannot reset an app in place, so instead a
+    session is quit at the end of a test if the test failed or changed its
+    state, otherwise it is kept for the next matching test.
+
+    Sessions started with ffmpeg are never reused: their recording covers the
+    whole session, so a reused one would hand a later test a recording of
+    earlier tests too.
+    """
+
+    def __init__(self, timings, tracer, enabled=True, adaptive_controller_delay=False):
+        self.timings = timings
+        self.tracer = tracer
+        self.enabled = enabled
+        self.adaptive_controller_delay = adaptive_controller_delay
+        self._sessions = {}
+        self._leased = []
+
+    @staticmethod
+    def records_video(start_request):
+        state = getattr(start_request, "__dict__", {})
+        return any(value for name, value in state.items() if "ffmpeg" in name.lower())
+
+    @staticmethod
+    def fingerprint(automator_class, address, start_request):
+        return "{}|{}|{}".format(automator_class.__name__, address, describe(start_request))
+
+    def acquire(self, automator_class, address, start_request):
+        key = self.fingerprint(automator_class, address, start_request)
+        automator = self._sessions.pop(key, None)
+        if automator is None:
+            attributes = {"automator": automator_class.__name__, "device": address}
+            session = self.tracer.wrap(automator_class, "start", attributes)(address, start_request)
+            automator = PooledAutomator(session, self.timings, self.tracer, attributes, reusable=not self.records_video(start_request),
+                                        adaptive_controller_delay=self.adaptive_controller_delay)
+        self._leased.append((key, automator))
+        return automator
+
+    def release(self, discard=False):
+        for key, automator in self._leased:
+            if discard or automator.dirty or not self.enabled or key in self._sessions:
+                automator.quit()
+            else:
+                self._sessions[key] = automator
+        self._leased = []
+
+    def close(self):
+        self.release(discard=True)
+        for automator in self._sessions.values():
+            automator.quit()
+        self._sessions = {}
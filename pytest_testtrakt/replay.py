@@ -0,0 +1,285 @@
+import base64
+import collections
+import glob
+import hashlib
+import http.server
+import json
+import os
+import re
+import shutil
+import socketserver
+import threading
+import time
+import urllib.error
+import urllib.request
+import warnings
+
+
+# hop-by-hop headers belong to a single connection, and a compressed body could not be inspected for artifacts
+SKIPPED_HEADERS = ("accept-encoding", "connection", "content-length", "host", "keep-alive", "proxy-authenticate",
+                   "proxy-authorization", "te", "trailer", "transfer-encoding", "upgrade")
+
+
+def local_file(value):
+    """Whether a string is the path of an existing local file, such as a screenshot or an image to find."""
+    if len(value) > 4096 or "\n" in value:
+        return False
+    try:
+        return os.path.isfile(value)
+    except (OSError, ValueError):
+        return False
+
+
+def file_hash(path):
+    with open(path, "rb") as artifact_file:
+        return hashlib.sha1(artifact_file.read()).hexdigest()
+
+
+def normalise(value):
+    """A request body with timeouts dropped and local file paths replaced by a hash of their content.
+
+    Timeouts change between runs (wait_for backs off randomly), and the
+    clients save screenshots to a new temporary file on every call, so
+    neither may be part of the key a response is replayed for.
+    """
+    if isinstance(value, dict):
+        return {name: normalise(field) for name, field in value.items() if "timeout" not in name.lower()}
+    if isinstance(value, list):
+        return [normalise(item) for item in value]
+    if isinstance(value, str) and local_file(value):
+        return "{{{{file:{}}}}}".format(file_hash(value))
+    return value
+
+
+def request_key(method, path, body):
+    try:
+        payload = json.dumps(normalise(json.loads(body.decode("utf-8"))), sort_keys=True) if body else ""
+    except ValueError:
+        payload = "sha1:" + hashlib.sha1(body).hexdigest()
+    return "{} {} {}".format(method, path, payload)
+
+
+class AutomatorRecording:
+    """Automator HTTP exchanges recorded per test, for running the suite without devices.
+
+    Exchanges are stored as JSON per automator address and per test, and
+    replayed in the order they were recorded for the same method, path and
+    normalised request body. Once they run out, the last one is repeated, as
+    replay can send a request more often than the recorded run did (wait_for
+    attempts, focus polls). Only a request the running test never recorded,
+    such as the start of a session another test opened, is answered with the
+    first matching response of any test. File paths in responses are copied
+    into the recording and handed back as paths to those copies on replay.
+    """
+
+    def __init__(self, directory, replay=False, latency="zero"):
+        self.directory = directory
+        self.replay = replay
+        self.latency = latency
+        self.exchanges = {}
+        self.pending = {}
+        self.fallback = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def safe_name(name):
+        return re.sub(r"[^\w.-]+", "_", name)
+
+    def path(self, upstream, test):
+        return os.path.join(self.directory, self.safe_name(upstream), self.safe_name(test) + ".json")
+
+    def keep_artifacts(self, value):
+        if isinstance(value, dict):
+            return {name: self.keep_artifacts(field) for name, field in value.items()}
+        if isinstance(value, list):
+            return [self.keep_artifacts(item) for item in value]
+        if isinstance(value, str) and local_file(value):
+            artifacts = os.path.join(self.directory, "artifacts")
+            os.makedirs(artifacts, exist_ok=True)
+            name = "{}-{}".format(file_hash(value), os.path.basename(value))
+            shutil.copyfile(value, os.path.join(artifacts, name))
+            return "{{{{artifact:{}}}}}".format(name)
+        return value
+
+    def resolve_artifacts(self, value):
+        if isinstance(value, dict):
+            return {name: self.resolve_artifacts(field) for name, field in value.items()}
+        if isinstance(value, list):
+            return [self.resolve_artifacts(item) for item in value]
+        if isinstance(value, str):
+            match = re.match(r"^\{\{artifact:(.+)\}\}$", value)
+            if match:
+                return os.path.abspath(os.path.join(self.directory, "artifacts", match.group(1)))
+        return value
+
+    def record(self, upstream, test, key, status, content_type, body, duration):
+        try:
+            response = {"json": self.keep_artifacts(json.loads(body.decode("utf-8")))}
+        except ValueError:
+            response = {"base64": base64.b64encode(body).decode("ascii")}
+        exchange = {"key": key, "status": status, "content_type": content_type, "response": response, "duration": duration}
+        with self._lock:
+            self.exchanges.setdefault((upstream, test), []).append(exchange)
+
+    def save(self, test):
+        with self._lock:
+            recorded = [(upstream, self.exchanges.pop((upstream, recorded_test))) for upstream, recorded_test in list(self.exchanges) if recorded_test == test]
+        for upstream, exchanges in recorded:
+            try:
+                os.makedirs(os.path.dirname(self.path(upstream, test)), exist_ok=True)
+                with open(self.path(upstream, test), "w") as recording_file:
+                    json.dump(exchanges, recording_file, indent=1)
+            except (OSError, TypeError, ValueError) as error:
+                warnings.warn("could not save the automator recording of {}: {}".format(test, error))
+
+    def load(self, path):
+        try:
+            with open(path) as recording_file:
+                return json.load(recording_file)
+        except (OSError, ValueError):
+            return []
+
+    def queue(self, upstream, test):
+        if (upstream, test) not in self.pending:
+            pending = {}
+            for exchange in self.load(self.path(upstream, test)):
+                pending.setdefault(exchange["key"], collections.deque()).append(exchange)
+            self.pending[(upstream, test)] = pending
+        return self.pending[(upstream, test)]
+
+    def any_test(self, upstream, key):
+        if upstream not in self.fallback:
+            fallback = {}
+            for path in sorted(glob.glob(os.path.join(self.directory, self.safe_name(upstream), "*.json"))):
+                for exchange in self.load(path):
+                    fallback.setdefault(exchange["key"], exchange)
+            self.fallback[upstream] = fallback
+        return self.fallback[upstream].get(key)
+
+    def respond(self, upstream, test, key):
+        """The recorded (status, content type, body) for a request, or None if none was recorded."""
+        with self._lock:
+            exchanges = self.queue(upstream, test).get(key)
+            if exchanges:
+                exchange = exchanges.popleft() if len(exchanges) > 1 else exchanges[0]
+            else:
+                exchange = self.any_test(upstream, key)
+        if exchange is None:
+            return None
+        if self.latency == "realistic":
+            time.sleep(exchange["duration"] / 1000)
+        response = exchange["response"]
+        if "json" in response:
+            body = json.dumps(self.resolve_artifacts(response["json"])).encode("utf-8")
+        else:
+            body = base64.b64decode(response["base64"])
+        return exchange["status"], exchange["content_type"], body
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class RecordingProxy:
+    """A local HTTP proxy in front of one automator server that records or replays its exchanges.
+
+    The automator clients are pointed at the proxy instead of the server, so
+    recording and replay cover the real client library and its HTTP calls.
+    Requests made outside of a test, such as quitting pooled sessions, are
+    kept under a per-worker session name.
+    """
+
+    def __init__(self, upstream, recording, tracer):
+        self.upstream = upstream
+        self.recording = recording
+        self.tracer = tracer
+        self.address = None
+        self._server = None
+        # the automator runs on the local network, so never go through an environment proxy
+        self._opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+    def current_test(self):
+        return self.tracer.current_test or "session-{}".format(os.environ.get("PYTEST_XDIST_WORKER", "gw0"))
+
+    def forward(self, method, path, headers, body):
+        request = urllib.request.Request(self.upstream.rstrip("/") + path, data=body or None, method=method,
+                                         headers={name: value for name, value in headers.items() if name.lower() not in SKIPPED_HEADERS})
+        # no timeout, a locate call waits on the server for as long as the test asked it to
+        try:
+            with self._opener.open(request) as response:
+                return response.status, response.headers.get("Content-Type"), response.read()
+        except urllib.error.HTTPError as error:
+            return error.code, error.headers.get("Content-Type"), error.read()
+
+    def handle(self, method, path, headers, body):
+        test = self.current_test()
+        key = request_key(method, path, body)
+        if self.recording.replay:
+            response = self.recording.respond(self.upstream, test, key)
+            if response is None:
+                message = "no recorded response for {} in {}".format(key, test)
+                return 404, "application/json", json.dumps({"error": message}).encode("utf-8")
+            return response
+        start = time.perf_counter()
+        try:
+            status, content_type, response_body = self.forward(method, path, headers, body)
+        except (OSError, urllib.error.URLError) as error:
+            return 502, "application/json", json.dumps({"error": "{} is unreachable: {}".format(self.upstream, error)}).encode("utf-8")
+        self.recording.record(self.upstream, test, key, status, content_type, response_body, (time.perf_counter() - start) * 1000)
+        return status, content_type, response_body
+
+    def start(self):
+        proxy = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+
+            def exchange(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, content_type, response_body = proxy.handle(self.command, self.path, self.headers, body)
+                self.send_response(status)
+                if content_type:
+                    self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(response_body)))
+                self.end_headers()
+                self.wfile.write(response_body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = exchange
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.address = "http://127.0.0.1:{}".format(self._server.server_address[1])
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class RecordingProxies:
+    """One RecordingProxy per automator address a test run talks to, started on first use."""
+
+    def __init__(self, recording, tracer):
+        self.recording = recording
+        self.tracer = tracer
+        self._proxies = {}
+
+    def address_for(self, upstream):
+        if upstream not in self._proxies:
+            self._proxies[upstream] = RecordingProxy(upstream, self.recording, self.tracer).start()
+        return self._proxies[upstream].address
+
+    def save(self, test):
+        if not self.recording.replay:
+            self.recording.save(test)
+
+    def close(self):
+        for proxy in self._proxies.values():
+            proxy.stop()
+        self._proxies = {}
+        if not self.recording.replay:
+            for upstream, test in list(self.recording.exchanges):
+                self.recording.save(test)
@@ -0,0 +1,86 @@
+import json
+import os
+import time
+
+from pytest_testtrakt.inventory import DeviceInventory
+
+
+# start requests carry device passwords, remote API tokens and OCR credential paths, none of which may reach a report
+SECRET_FIELDS = ("password", "token", "secret", "credential")
+
+
+def describe(value, skip=()):
+    """A stable, readable description of a request object or call argument."""
+    state = getattr(value, "__dict__", None)
+    if state is None:
+        return repr(value)
+    return json.dumps({name: field for name, field in state.items() if not any(word in name.lower() for word in skip)}, sort_keys=True, default=str)
+
+
+class Tracer:
+    """Records a span for every automator call and exports them as a Chrome trace.
+
+    Each span carries the test that made the call, the automator and device,
+    the call arguments (locator type and value, controller press, etc.) and,
+    depending on the result, the number of matches or the payload size.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.current_test = None
+        self._origin = time.perf_counter()
+
+    def wrap(self, function, name, attributes):
+        def traced(*args, **kwargs):
+            span_attributes = dict(attributes, arguments=", ".join(describe(argument, skip=SECRET_FIELDS) for argument in args))
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as raised:
+                span_attributes["error"] = type(raised).__name__
+                raise
+            else:
+                if isinstance(result, (list, tuple)):
+                    span_attributes["matches"] = len(result)
+                elif isinstance(result, (str, bytes)):
+                    span_attributes["payload_size"] = len(result)
+                return result
+            finally:
+                self.record(name, start, time.perf_counter(), span_attributes)
+        return traced
+
+    def record(self, name, start, end, attributes):
+        self.spans.append({"name": name, "test": self.current_test, "start": (start - self._origin) * 1000000, "duration": (end - start) * 1000000, "attributes": attributes})
+
+    def summary_lines(self, test):
+        return ["{:9.1f}ms  {}  {}".format(span["duration"] / 1000, span["name"], json.dumps(span["attributes"], sort_keys=True)) for span in self.spans if span["test"] == test]
+
+    def export_chrome_trace(self, path):
+        events = [{
+            "name": span["name"],
+            "cat": "automator",
+            "ph": "X",
+            "ts": round(span["start"]),
+            "dur": round(span["duration"]),
+            "pid": os.getpid(),
+            "tid": DeviceInventory.worker_index(),
+            "args": dict(span["attributes"], test=span["test"]),
+        } for span in self.spans]
+        with open(path, "w") as trace_file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace_file, indent=1)
+
+
+class TracedClient:
+    """Wraps an automator sub-client so each call is recorded as a span."""
+
+    def __init__(self, client, name, tracer, attributes):
+        self._client = client
+        self._name = name
+        self._tracer = tracer
+        self._attributes = attributes
+
+    def __getattr__(self, name):
+        attribute = getattr(self._client, name)
+        if not callable(attribute):
+            return attribute
+        return self._tracer.wrap(attribute, "{}.{}".format(self._name, name), self._attributes)
@@ -9,6 +9,7 @@ setup(
     version="1.0.0",
     packages=find_packages(),
     install_requires=['pytest', 'testtrakt-core-api'],
+    extras_require={'parallel': ['pytest-xdist']},
     python_requires='>=3.6.5',
     cmdclass={'clean': CleanCommand,}
 )
\ No newline at end of file
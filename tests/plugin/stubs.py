@@ -0,0 +1,223 @@
+import base64
+import enum
+import http.server
+import json
+import os
+import tempfile
+import threading
+import urllib.request
+
+
+class LocatorType(enum.Enum):
+    TEXT = "TEXT"
+    CSS = "CSS"
+    IMAGE = "IMAGE"
+
+
+class StubLocatorRequest:
+
+    def __init__(self, locator_type, value):
+        self.locator_type = locator_type
+        self.value = value
+        self.timeout = 0
+
+    def with_timeout(self, timeout):
+        self.timeout = timeout
+        return self
+
+
+class StubStartRequest:
+
+    def __init__(self, ip_address):
+        self.ip_address = ip_address
+        self.ffmpeg_bin = None
+
+    def with_ffmpeg(self, ffmpeg_bin):
+        self.ffmpeg_bin = ffmpeg_bin
+        return self
+
+
+class StubOptionsRequest:
+
+    def __init__(self):
+        self.default_controller_delay = None
+        self.default_image_find_similarity = None
+
+    def set_default_controller_delay(self, delay):
+        self.default_controller_delay = delay
+        return self
+
+    def set_default_image_find_similarity(self, similarity):
+        self.default_image_find_similarity = similarity
+        return self
+
+
+class StubElement:
+
+    def __init__(self, x, y, width, height, confidence=100.0):
+        self.box = (x, y, width, height)
+        self.confidence = confidence
+
+    def get_x(self):
+        return self.box[0]
+
+    def get_y(self):
+        return self.box[1]
+
+    def get_width(self):
+        return self.box[2]
+
+    def get_height(self):
+        return self.box[3]
+
+    def get_confidence(self):
+        return self.confidence
+
+
+class StubClient:
+
+    def __init__(self, automator, name):
+        self._automator = automator
+        self._name = name
+
+    def __getattr__(self, name):
+        def call(*args):
+            self._automator.calls.append("{}.{}".format(self._name, name))
+            self._automator.arguments.append(args)
+            return self._automator.responses.get("{}.{}".format(self._name, name))
+        return call
+
+
+class StubAutomator:
+    """An in-memory automator that logs every call and answers from ``responses``."""
+
+    started = []
+
+    def __init__(self, address, start_request):
+        self.address = address
+        self.start_request = start_request
+        self.calls = []
+        self.arguments = []
+        self.responses = {}
+        self.quit_called = False
+        StubAutomator.started.append(self)
+
+    def locator(self):
+        return StubClient(self, "locator")
+
+    def controller(self):
+        return StubClient(self, "controller")
+
+    def display(self):
+        return StubClient(self, "display")
+
+    def options(self):
+        return StubClient(self, "options")
+
+    def system(self):
+        return StubClient(self, "system")
+
+    def web_profiler(self):
+        return StubClient(self, "web_profiler")
+
+    def get_page_source(self):
+        return "<html></html>"
+
+    def quit(self):
+        self.quit_called = True
+
+
+class StubAutomatorServer:
+    """A local HTTP stand-in for an automator server.
+
+    Every request is logged in ``requests`` and answered with the JSON in
+    ``responses`` for its path, or ``{"status": "ok"}``.
+    """
+
+    def __init__(self, responses=None):
+        self.requests = []
+        self.responses = responses or {}
+        self._server = None
+
+    def start(self):
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                self.answer()
+
+            def do_POST(self):
+                self.answer()
+
+            def answer(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                stub.requests.append((self.command, self.path, json.loads(body) if body else None))
+                payload = json.dumps(stub.responses.get(self.path, {"status": "ok"})).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.address = "http://127.0.0.1:{}".format(self._server.server_address[1])
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class HttpStubLocator:
+
+    def __init__(self, automator):
+        self._automator = automator
+
+    def locate(self, locator_request):
+        response = self._automator.post("/locate", {"type": locator_request.locator_type.value, "value": locator_request.value, "timeout": locator_request.timeout})
+        return [StubElement(*box) for box in response.get("elements", [])]
+
+
+class HttpStubDisplay:
+
+    def __init__(self, automator):
+        self._automator = automator
+
+    def get_image(self):
+        # like the real clients, the image is saved to a new temporary file on every call
+        response = self._automator.post("/display/image", {})
+        image_file, path = tempfile.mkstemp(suffix=".png")
+        os.write(image_file, base64.b64decode(response["image"]))
+        os.close(image_file)
+        return path
+
+
+class HttpStubAutomator:
+    """A minimal automator client that talks JSON over HTTP to ``address``."""
+
+    def __init__(self, address, start_request):
+        self.address = address
+        self.post("/session", vars(start_request))
+
+    def post(self, path, payload):
+        request = urllib.request.Request(self.address + path, data=json.dumps(payload).encode(), headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+
+    def locator(self):
+        return HttpStubLocator(self)
+
+    def display(self):
+        return HttpStubDisplay(self)
+
+    def get_page_source(self):
+        return self.post("/page_source", {}).get("page_source", "")
+
+    def quit(self):
+        self.post("/session/quit", {})
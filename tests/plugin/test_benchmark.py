@@ -0,0 +1,102 @@
+import json
+import types
+
+import pytest
+
+from pytest_testtrakt import plugin
+from pytest_testtrakt.locating import LocateTimings
+
+from stubs import LocatorType, StubLocatorRequest
+
+pytest_plugins = ["pytester"]
+
+# self-contained so xdist workers, which do not share this module's sys.path, can import it
+TIMED_TESTS = """
+import enum
+
+
+class LocatorType(enum.Enum):
+    TEXT = "TEXT"
+
+
+class LocatorRequest:
+
+    def __init__(self, locator_type):
+        self.locator_type = locator_type
+
+
+def test_locates(request):
+    for elapsed_ms in range(1, 101):
+        request.config.locate_timings.record(LocatorRequest(LocatorType.TEXT), elapsed_ms * {scale}, True)
+"""
+
+
+def timings(elapsed_by_type):
+    timings = LocateTimings()
+    for locator_type, elapsed in elapsed_by_type.items():
+        for elapsed_ms in elapsed:
+            timings.record(StubLocatorRequest(locator_type, "Big Hits"), elapsed_ms, True)
+    return timings
+
+
+class Test_LocateBenchmark:
+
+    def test_percentiles_per_locator_type(self):
+        benchmark = timings({LocatorType.TEXT: range(1, 101), LocatorType.CSS: [40]}).benchmark()["locate"]
+        assert benchmark["LocatorType.TEXT"]["calls"] == 100
+        assert (benchmark["LocatorType.TEXT"]["p50"], benchmark["LocatorType.TEXT"]["p95"], benchmark["LocatorType.TEXT"]["p99"]) == (50, 95, 99)
+        assert benchmark["LocatorType.CSS"]["p99"] == 40
+        assert benchmark["LocatorType.TEXT"]["mean"] == 50.5
+        assert benchmark["LocatorType.CSS"]["mean"] == 40
+
+    def test_regressions_beyond_tolerance_only(self):
+        baseline = timings({LocatorType.TEXT: [100], LocatorType.CSS: [100]}).benchmark()
+        current = timings({LocatorType.TEXT: [119], LocatorType.CSS: [121]})
+        assert current.regressions(baseline, 0.2) == ["LocatorType.CSS: p95 121ms, baseline 100ms"]
+
+    def test_new_locator_types_are_not_regressions(self):
+        baseline = timings({LocatorType.TEXT: [100]}).benchmark()
+        assert timings({LocatorType.CSS: [1000]}).regressions(baseline, 0.2) == []
+
+    def test_controller_merges_worker_samples(self):
+        config = types.SimpleNamespace(locate_timings=LocateTimings())
+        for elapsed in ([10, 20], [30, 40]):
+            plugin.pytest_testnodedown(types.SimpleNamespace(config=config, workeroutput={"locate_timings": timings({LocatorType.TEXT: elapsed}).export()}), None)
+        assert config.locate_timings.benchmark() == timings({LocatorType.TEXT: [10, 20, 30, 40]}).benchmark()
+        assert sum(len(samples) for samples in config.locate_timings.samples.values()) == 4
+
+    def test_writes_benchmark_and_fails_on_regression(self, pytester):
+        baseline = pytester.path / "baseline.json"
+        pytester.makepyfile(test_timed=TIMED_TESTS.format(scale=1))
+        pytester.runpytest("-p", "pytest_testtrakt.plugin", "--benchmark-json", str(baseline)).assert_outcomes(passed=1)
+        assert json.loads(baseline.read_text())["locate"]["LocatorType.TEXT"]["p95"] == 95
+
+        pytester.makepyfile(test_timed=TIMED_TESTS.format(scale=2))
+        result = pytester.runpytest("-p", "pytest_testtrakt.plugin", "--benchmark-baseline", str(baseline))
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
+        result.stdout.fnmatch_lines(["*locate benchmark regressions*", "LocatorType.TEXT: p95 190ms, baseline 95ms"])
+
+    def test_workers_leave_benchmark_to_the_controller(self, pytester):
+        pytester.makeconftest("""
+            import pytest
+
+            @pytest.hookimpl(tryfirst=True)
+            def pytest_configure(config):
+                config.workerinput = {"workerid": "gw0"}
+                config.workeroutput = {}
+
+            def pytest_unconfigure(config):
+                print("exported {} samples".format(len(config.workeroutput["locate_timings"]["samples_by_type"]["LocatorType.TEXT"])))
+        """)
+        pytester.makepyfile(test_timed=TIMED_TESTS.format(scale=1))
+        result = pytester.runpytest("-s", "-p", "pytest_testtrakt.plugin", "--benchmark-json", "benchmark.json")
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["*exported 100 samples*"])
+        assert not (pytester.path / "benchmark.json").exists()
+
+    def test_single_benchmark_file_under_xdist(self, pytester):
+        pytest.importorskip("xdist")
+        pytester.makepyfile(test_timed=TIMED_TESTS.format(scale=1), test_more=TIMED_TESTS.format(scale=1))
+        pytester.runpytest("-p", "pytest_testtrakt.plugin", "-n", "2", "--dist", "loadgroup", "--benchmark-json", "benchmark.json").assert_outcomes(passed=2)
+        assert sorted(path.name for path in pytester.path.glob("benchmark*.json")) == ["benchmark.json"]
+        assert json.loads((pytester.path / "benchmark.json").read_text())["locate"]["LocatorType.TEXT"]["calls"] == 200
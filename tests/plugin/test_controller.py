@@ -0,0 +1,128 @@
+import time
+
+import pytest
+
+from pytest_testtrakt.controller import SettlingController
+from pytest_testtrakt.locating import LocateTimings
+from pytest_testtrakt.pool import AutomatorPool
+from pytest_testtrakt.tracing import Tracer
+
+from stubs import StubAutomator, StubOptionsRequest, StubStartRequest
+
+
+class FocusAfterPress:
+    """A controller whose focus moves ``settle`` seconds after each press."""
+
+    def __init__(self, settle):
+        self.settle = settle
+        self.pressed_at = None
+        self.presses = []
+
+    def send_command(self, controller_press):
+        self.presses.append(controller_press)
+        self.pressed_at = time.monotonic()
+
+    def focused_element(self):
+        if self.pressed_at is not None and time.monotonic() - self.pressed_at >= self.settle:
+            return "moved"
+        return "start"
+
+
+class Test_SettlingController:
+
+    @pytest.fixture(autouse=True)
+    def tracer(self):
+        self.tracer = Tracer()
+
+    def settle_span(self):
+        return [span["attributes"] for span in self.tracer.spans if span["name"] == "controller.settle"]
+
+    def test_returns_once_focus_moves(self):
+        controller = FocusAfterPress(0.05)
+        settling = SettlingController(controller, controller.focused_element, lambda: 2000, self.tracer, {}, poll_interval=10)
+        start = time.monotonic()
+        settling.send_command("DOWN")
+        assert controller.presses == ["DOWN"]
+        assert time.monotonic() - start < 1
+        assert self.settle_span() == [{"arguments": "'DOWN'", "max_delay": 2000, "settled": True}]
+
+    def test_waits_at_most_the_delay(self):
+        controller = FocusAfterPress(10)
+        settling = SettlingController(controller, controller.focused_element, lambda: 100, self.tracer, {}, poll_interval=10)
+        start = time.monotonic()
+        settling.send_command("DOWN")
+        assert 0.1 <= time.monotonic() - start < 1
+        assert self.settle_span()[0]["settled"] is False
+
+    def test_focus_read_errors_after_the_press_are_not_settled_yet(self):
+        controller = FocusAfterPress(0.05)
+
+        def transitioning():
+            # nothing is focused between the press and the next screen
+            if controller.pressed_at is not None and time.monotonic() - controller.pressed_at < 0.03:
+                raise RuntimeError("no focused node")
+            return controller.focused_element()
+
+        settling = SettlingController(controller, transitioning, lambda: 2000, self.tracer, {}, poll_interval=10)
+        start = time.monotonic()
+        settling.send_command("DOWN")
+        assert time.monotonic() - start < 1
+        assert self.settle_span()[0]["settled"] is True
+
+    def test_waits_full_delay_when_focus_cannot_be_read(self):
+        controller = FocusAfterPress(0)
+
+        def unreadable():
+            raise NotImplementedError()
+
+        settling = SettlingController(controller, unreadable, lambda: 100, self.tracer, {})
+        start = time.monotonic()
+        settling.send_command("DOWN")
+        assert controller.presses == ["DOWN"]
+        assert time.monotonic() - start >= 0.1
+        assert self.settle_span()[0]["focus_error"] == "NotImplementedError"
+
+    def test_sends_unchanged_without_a_delay(self):
+        controller = FocusAfterPress(10)
+        settling = SettlingController(controller, controller.focused_element, lambda: None, self.tracer, {})
+        start = time.monotonic()
+        settling.send_command("DOWN")
+        assert controller.presses == ["DOWN"]
+        assert time.monotonic() - start < 0.1
+
+
+class Test_AdaptiveControllerDelay:
+
+    ADDRESS = "http://localhost:9070"
+
+    @pytest.fixture(autouse=True)
+    def pool(self):
+        StubAutomator.started = []
+        self.pool = AutomatorPool(LocateTimings(), Tracer(), adaptive_controller_delay=True)
+        yield
+        self.pool.close()
+
+    def test_moves_controller_delay_from_server_to_pool(self):
+        automator = self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        options_request = StubOptionsRequest().set_default_controller_delay(1000)
+        automator.options().set(options_request)
+        sent = StubAutomator.started[0].arguments[-1][0]
+        assert sent.default_controller_delay == 0
+        assert options_request.default_controller_delay == 1000
+        assert automator.controller_delay == 1000
+
+    def test_leaves_other_options_to_the_server(self):
+        automator = self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        options_request = StubOptionsRequest().set_default_image_find_similarity(.9)
+        automator.options().set(options_request)
+        assert StubAutomator.started[0].arguments[-1][0] is options_request
+        assert automator.controller_delay is None
+
+    def test_disabled_by_default(self):
+        pool = AutomatorPool(LocateTimings(), Tracer())
+        automator = pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        options_request = StubOptionsRequest().set_default_controller_delay(1000)
+        automator.options().set(options_request)
+        assert StubAutomator.started[-1].arguments[-1][0] is options_request
+        assert automator.controller_delay is None
+        pool.close()
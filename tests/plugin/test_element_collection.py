@@ -0,0 +1,34 @@
+from pytest_testtrakt.locating import ElementCollection
+
+from stubs import StubElement
+
+
+class Test_ElementCollection:
+
+    HEADER = StubElement(0, 0, 1920, 100)
+    # two rows of tiles below the header, the second tile of the first row sits slightly lower
+    TILES = [StubElement(500, 210, 200, 100, 60.0), StubElement(100, 200, 200, 100), StubElement(300, 400, 200, 100), StubElement(100, 400, 200, 100, 80.0)]
+
+    def test_of_wraps_lists_only(self):
+        assert isinstance(ElementCollection.of(self.TILES), ElementCollection)
+        assert ElementCollection.of(None) is None
+
+    def test_within(self):
+        assert ElementCollection(self.TILES).within(0, 0, 960, 350) == [self.TILES[0], self.TILES[1]]
+
+    def test_relative_to_another_element(self):
+        tiles = ElementCollection([self.HEADER] + self.TILES)
+        assert tiles.below(self.HEADER) == self.TILES
+        assert tiles.above(self.TILES[2]) == [self.HEADER, self.TILES[0], self.TILES[1]]
+        assert tiles.left_of(self.TILES[2]) == [self.TILES[1], self.TILES[3]]
+        assert tiles.right_of(self.TILES[1]) == [self.TILES[0], self.TILES[2]]
+
+    def test_queries_chain(self):
+        assert ElementCollection([self.HEADER] + self.TILES).below(self.HEADER).with_confidence(90).left_of(self.TILES[2]) == [self.TILES[1]]
+
+    def test_nearest(self):
+        assert ElementCollection(self.TILES).nearest(320, 460) is self.TILES[2]
+        assert ElementCollection().nearest(0, 0) is None
+
+    def test_reading_order(self):
+        assert ElementCollection(self.TILES).reading_order() == [self.TILES[1], self.TILES[0], self.TILES[3], self.TILES[2]]
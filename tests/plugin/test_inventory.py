@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from pytest_testtrakt.inventory import DeviceInventory
+
+import stubs
+from stubs import StubAutomatorServer
+
+pytest_plugins = ["pytester"]
+
+STUB_TESTS = """
+import pytest
+
+from stubs import HttpStubAutomator, StubStartRequest
+
+
+class Test_StubTests:
+
+    STUB_AUTOMATOR_ADDRESS = "http://localhost:1"
+    STUB_IP_ADDRESS = "0.0.0.0"
+
+    @pytest.fixture(autouse=True)
+    def use_automator_pool(self, automator_pool):
+        self.automator_pool = automator_pool
+
+    def test_page_source(self):
+        stub_automator = self.automator_pool.acquire(HttpStubAutomator, self.STUB_AUTOMATOR_ADDRESS, StubStartRequest(self.STUB_IP_ADDRESS))
+        assert "Big Hits" in stub_automator.get_page_source()
+"""
+
+UNLISTED_TESTS = """
+
+class Test_Unlisted:
+
+    @pytest.mark.parametrize("index", range(8))
+    def test_worker(self, index):
+        import os
+        with open("workers.txt", "a") as workers_file:
+            workers_file.write(os.environ["PYTEST_XDIST_WORKER"] + "\\n")
+"""
+
+
+class Test_DeviceInventory:
+
+    @pytest.fixture
+    def servers(self):
+        servers = [StubAutomatorServer({"/page_source": {"page_source": "Big Hits"}}).start() for _ in range(2)]
+        yield servers
+        for server in servers:
+            server.stop()
+
+    def write_inventory(self, pytester, servers):
+        inventory = {"Test_StubTests": [{"STUB_AUTOMATOR_ADDRESS": server.address, "STUB_IP_ADDRESS": "192.168.1.{}".format(index)} for index, server in enumerate(servers)]}
+        return str(pytester.makefile(".json", inventory=json.dumps(inventory)))
+
+    @pytest.mark.parametrize("worker, device", [("gw0", 0), ("gw1", 1), ("gw2", 0)])
+    def test_worker_is_pinned_to_a_device(self, pytester, monkeypatch, servers, worker, device):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", worker)
+        pytester.makepyfile(test_stub=STUB_TESTS)
+        result = pytester.runpytest("-p", "pytest_testtrakt.plugin", "--device-inventory", self.write_inventory(pytester, servers))
+        result.assert_outcomes(passed=1)
+
+        # only the pinned device's automator was used, with the pinned device ip
+        assert servers[device].requests[0][:2] == ("POST", "/session")
+        assert servers[device].requests[0][2]["ip_address"] == "192.168.1.{}".format(device)
+        assert servers[1 - device].requests == []
+
+    def test_class_without_inventory_keeps_its_addresses(self):
+        class Test_Other:
+            pass
+
+        assert DeviceInventory({"Test_StubTests": [{"STUB_AUTOMATOR_ADDRESS": "http://farm-1"}]}).device_for(Test_Other) == {}
+
+    def test_more_workers_than_devices_is_a_usage_error(self, pytester, servers):
+        pytest.importorskip("xdist")
+        pytester.makepyfile(test_stub=STUB_TESTS)
+        result = pytester.runpytest("-p", "pytest_testtrakt.plugin", "-n", "3", "--dist", "loadgroup", "--device-inventory", self.write_inventory(pytester, servers))
+        result.stderr.fnmatch_lines(["*3 workers requested but the device inventory only lists 2 device(s) for Test_StubTests*"])
+
+    def test_workers_without_loadgroup_is_a_usage_error(self, pytester, servers):
+        pytest.importorskip("xdist")
+        pytester.makepyfile(test_stub=STUB_TESTS)
+        result = pytester.runpytest("-p", "pytest_testtrakt.plugin", "-n", "2", "--device-inventory", self.write_inventory(pytester, servers))
+        result.stderr.fnmatch_lines(["*running tests on 2 workers needs --dist loadgroup*"])
+
+    def test_class_without_inventory_runs_on_one_worker(self, pytester, servers):
+        pytest.importorskip("xdist")
+        # xdist workers do not share this module's sys.path, so they import the stubs from the test directory
+        pytester.makepyfile(stubs=open(stubs.__file__).read(), test_stub=STUB_TESTS + UNLISTED_TESTS)
+        result = pytester.runpytest("-p", "pytest_testtrakt.plugin", "-n", "2", "--dist", "loadgroup", "--device-inventory", self.write_inventory(pytester, servers))
+        result.assert_outcomes(passed=9)
+        workers = (pytester.path / "workers.txt").read_text().split()
+        assert len(workers) == 8 and len(set(workers)) == 1
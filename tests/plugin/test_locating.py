@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from pytest_testtrakt.locating import LocateTimings, TimedLocator
+
+from stubs import LocatorType, StubElement, StubLocatorRequest
+
+
+class AutomatorError(Exception):
+    pass
+
+
+class SlowLocator:
+    """Matches after ``appears_after`` seconds and, like the server, waits out the request timeout on a miss."""
+
+    def __init__(self, appears_after, miss_error=None):
+        self.started = time.monotonic()
+        self.appears_after = appears_after
+        self.miss_error = miss_error
+        self.timeouts = []
+        self.sent = []
+        self.finished = []
+
+    def locate(self, locator_request):
+        self.timeouts.append(locator_request.timeout)
+        self.sent.append(time.monotonic())
+        wait_until = self.started + self.appears_after
+        time.sleep(max(0, min(wait_until - time.monotonic(), locator_request.timeout / 1000.0)))
+        self.finished.append(time.monotonic())
+        if time.monotonic() >= wait_until:
+            return [StubElement(0, 0, 10, 10)]
+        if self.miss_error is not None:
+            raise self.miss_error
+        return []
+
+
+class Test_TimedLocator:
+
+    @pytest.fixture(autouse=True)
+    def timings(self):
+        self.timings = LocateTimings()
+
+    def test_returns_as_soon_as_element_appears(self):
+        locator = SlowLocator(appears_after=0.1)
+        start = time.monotonic()
+        elements = TimedLocator(locator, self.timings).wait_for(StubLocatorRequest(LocatorType.TEXT, "roku"), 5000)
+        assert len(elements) == 1
+        assert time.monotonic() - start < 0.5
+
+    def test_timeout_sends_no_attempt_after_deadline(self):
+        locator = SlowLocator(appears_after=60)
+        start = time.monotonic()
+        elements = TimedLocator(locator, self.timings).wait_for(StubLocatorRequest(LocatorType.TEXT, "roku"), 1000)
+        assert elements == []
+
+        # the last attempt waited until the deadline, and none was sent after it
+        assert locator.finished[-1] >= start + 1.0
+        assert all(sent < start + 1.0 for sent in locator.sent)
+
+    def test_retries_errors_until_deadline(self):
+        locator = SlowLocator(appears_after=60, miss_error=AutomatorError("no match for locator"))
+        with pytest.raises(AutomatorError):
+            TimedLocator(locator, self.timings).wait_for(StubLocatorRequest(LocatorType.TEXT, "roku"), 600)
+        assert len(locator.timeouts) > 1
+
+    @pytest.mark.parametrize("error", [ConnectionRefusedError("connection refused"), ValueError("invalid xpath")])
+    def test_raises_transport_and_usage_errors_immediately(self, error):
+        locator = SlowLocator(appears_after=60, miss_error=error)
+        with pytest.raises(type(error)):
+            TimedLocator(locator, self.timings).wait_for(StubLocatorRequest(LocatorType.CSS, "div["), 5000)
+        assert len(locator.timeouts) == 1
+
+    def test_records_time_to_match(self):
+        TimedLocator(SlowLocator(appears_after=0), self.timings).locate(StubLocatorRequest(LocatorType.TEXT, "roku").with_timeout(100))
+        TimedLocator(SlowLocator(appears_after=60), self.timings).wait_for(StubLocatorRequest(LocatorType.TEXT, "roku"), 300)
+
+        # both calls are grouped under one locator, whatever their timeouts
+        assert list(self.timings.samples) == ['{"locator_type": "LocatorType.TEXT", "value": "roku"}']
+        assert [matched for _, matched in self.timings.samples['{"locator_type": "LocatorType.TEXT", "value": "roku"}']] == [True, False]
+        assert "2 calls, 1 misses" in self.timings.summary_lines()[0]
@@ -0,0 +1,79 @@
+import pytest
+
+from pytest_testtrakt.locating import LocateTimings
+from pytest_testtrakt.pool import AutomatorPool
+from pytest_testtrakt.tracing import Tracer
+
+from stubs import StubAutomator, StubStartRequest
+
+
+class Test_AutomatorPool:
+
+    ADDRESS = "http://localhost:9070"
+
+    @pytest.fixture(autouse=True)
+    def pool(self):
+        StubAutomator.started = []
+        self.pool = AutomatorPool(LocateTimings(), Tracer())
+        yield
+        self.pool.close()
+
+    def test_reuses_session_for_same_start_request(self):
+        first = self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        self.pool.release()
+        second = self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        assert first is second
+        assert len(StubAutomator.started) == 1
+
+    def test_new_session_for_different_start_request_or_address(self):
+        self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        self.pool.release()
+        self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.2"))
+        self.pool.acquire(StubAutomator, "http://localhost:9071", StubStartRequest("10.0.0.1"))
+        assert len(StubAutomator.started) == 3
+
+    def test_quits_session_after_failed_test(self):
+        self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        self.pool.release(discard=True)
+        assert StubAutomator.started[0].quit_called
+        self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        assert len(StubAutomator.started) == 2
+
+    @pytest.mark.parametrize("use_session", [
+        lambda automator: automator.options().set("delay"),
+        lambda automator: automator.controller().send_command("DOWN"),
+        lambda automator: automator.display().get_recording(),
+        lambda automator: automator.system().get_console_logs(),
+        lambda automator: automator.web_profiler().get_console_logs(),
+        lambda automator: automator.web_profiler().execute_script("location.reload()"),
+    ])
+    def test_quits_session_after_state_changing_call(self, use_session):
+        use_session(self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1")))
+        self.pool.release()
+        assert StubAutomator.started[0].quit_called
+
+    def test_keeps_session_after_read_only_calls(self):
+        automator = self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        automator.display().get_image()
+        automator.locator().locate("request")
+        assert "<html>" in automator.get_page_source()
+        self.pool.release()
+        assert not StubAutomator.started[0].quit_called
+
+    def test_never_reuses_ffmpeg_sessions(self):
+        # the recording of a reused session would cover earlier tests as well
+        self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1").with_ffmpeg("/usr/bin/ffmpeg"))
+        self.pool.release()
+        assert StubAutomator.started[0].quit_called
+
+    def test_disabled_pool_quits_every_session(self):
+        self.pool.enabled = False
+        self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        self.pool.release()
+        assert StubAutomator.started[0].quit_called
+
+    def test_close_quits_pooled_sessions(self):
+        self.pool.acquire(StubAutomator, self.ADDRESS, StubStartRequest("10.0.0.1"))
+        self.pool.release()
+        self.pool.close()
+        assert StubAutomator.started[0].quit_called
@@ -0,0 +1,120 @@
+import base64
+import json
+
+import pytest
+
+from pytest_testtrakt.replay import AutomatorRecording, normalise, request_key
+
+from stubs import StubAutomatorServer
+
+pytest_plugins = ["pytester"]
+
+STUB_TESTS = """
+import pytest
+
+from stubs import HttpStubAutomator, LocatorType, StubLocatorRequest, StubStartRequest
+
+
+class Test_StubTests:
+
+    STUB_AUTOMATOR_ADDRESS = "{address}"
+
+    @pytest.fixture(autouse=True)
+    def use_automator_pool(self, automator_pool):
+        self.automator_pool = automator_pool
+
+    def test_page_source(self):
+        stub_automator = self.automator_pool.acquire(HttpStubAutomator, self.STUB_AUTOMATOR_ADDRESS, StubStartRequest("10.0.0.1"))
+        assert stub_automator.address != "{address}"
+        assert "Big Hits" in stub_automator.get_page_source()
+
+    def test_find_screenshot(self):
+        stub_automator = self.automator_pool.acquire(HttpStubAutomator, self.STUB_AUTOMATOR_ADDRESS, StubStartRequest("10.0.0.1"))
+        image = stub_automator.display().get_image()
+        with open(image, "rb") as image_file:
+            assert image_file.read() == b"screen"
+        elements = stub_automator.locator().wait_for(StubLocatorRequest(LocatorType.IMAGE, image), 1000)
+        assert elements.boxes() == [(10, 20, 30, 40)]
+"""
+
+UNRECORDED_TEST = """
+from stubs import HttpStubAutomator, StubStartRequest
+
+
+class Test_Unrecorded:
+
+    STUB_AUTOMATOR_ADDRESS = "http://127.0.0.1:1"
+
+    def test_unrecorded(self, automator_pool):
+        automator_pool.acquire(HttpStubAutomator, self.STUB_AUTOMATOR_ADDRESS, StubStartRequest("10.0.0.1"))
+"""
+
+
+class Test_RecordReplay:
+
+    @pytest.fixture
+    def server(self):
+        server = StubAutomatorServer({
+            "/page_source": {"page_source": "Big Hits"},
+            "/display/image": {"image": base64.b64encode(b"screen").decode()},
+            "/locate": {"elements": [[10, 20, 30, 40]]},
+        }).start()
+        yield server
+        server.stop()
+
+    def test_replays_recorded_run_without_the_server(self, pytester, server):
+        pytester.makepyfile(test_stub=STUB_TESTS.format(address=server.address))
+        pytester.runpytest("-p", "pytest_testtrakt.plugin", "--automator-record", "recording").assert_outcomes(passed=2)
+        recorded = len(server.requests)
+        assert [path for _, path, _ in server.requests].count("/session") == 1
+        server.stop()
+
+        # the screenshot is saved to a new temporary file, and so a new path, on replay too
+        pytester.runpytest("-p", "pytest_testtrakt.plugin", "--automator-replay", "recording").assert_outcomes(passed=2)
+        assert len(server.requests) == recorded
+
+        # each test replays alone, including the session start it shared when recorded
+        pytester.runpytest("-p", "pytest_testtrakt.plugin", "--automator-replay", "recording", "-k", "find_screenshot").assert_outcomes(passed=1)
+
+    def test_recording_is_json_per_address_and_test(self, pytester, server):
+        pytester.makepyfile(test_stub=STUB_TESTS.format(address=server.address))
+        pytester.runpytest("-p", "pytest_testtrakt.plugin", "--automator-record", "recording").assert_outcomes(passed=2)
+        recordings = sorted(path.name for path in (pytester.path / "recording").glob("*/*.json"))
+        assert recordings == ["test_stub.py_Test_StubTests_test_find_screenshot.json", "test_stub.py_Test_StubTests_test_page_source.json"]
+        page_source = pytester.path / "recording" / "http_127.0.0.1_{}".format(server.address.rsplit(":", 1)[1]) / "test_stub.py_Test_StubTests_test_page_source.json"
+        assert json.loads(page_source.read_text())[-1]["response"] == {"json": {"page_source": "Big Hits"}}
+
+    def test_unrecorded_request_is_not_found(self, pytester):
+        (pytester.path / "recording").mkdir()
+        pytester.makepyfile(test_unrecorded=UNRECORDED_TEST)
+        result = pytester.runpytest("-p", "pytest_testtrakt.plugin", "--automator-replay", "recording")
+        result.assert_outcomes(failed=1)
+        result.stdout.fnmatch_lines(["*HTTP Error 404*"])
+
+    def test_key_ignores_timeouts_and_temporary_file_paths(self, tmp_path):
+        first, second, other = tmp_path / "first.png", tmp_path / "second.png", tmp_path / "other.png"
+        first.write_bytes(b"screen")
+        second.write_bytes(b"screen")
+        other.write_bytes(b"other screen")
+
+        def key(path, timeout):
+            return request_key("POST", "/locate", json.dumps({"type": "IMAGE", "value": str(path), "timeout": timeout}).encode())
+
+        assert key(first, 1000) == key(second, 3000)
+        assert key(first, 1000) != key(other, 1000)
+        assert normalise({"value": "/no/such/file.png", "timeouts": [1]}) == {"value": "/no/such/file.png"}
+
+    def test_repeats_the_tests_last_response_before_falling_back_to_other_tests(self, tmp_path):
+        recording = AutomatorRecording(str(tmp_path))
+        # the other test sorts first, so it is what a fallback to any test would answer with
+        for test, responses in (("test_two", ["first", "second"]), ("test_one", ["other"])):
+            for response in responses:
+                recording.record("http://roku", test, "POST /locate", 200, "application/json", json.dumps(response).encode(), 1.0)
+        recording.record("http://roku", "test_one", "POST /page_source", 200, "application/json", b'"Big Hits"', 1.0)
+        recording.save("test_one")
+        recording.save("test_two")
+
+        replay = AutomatorRecording(str(tmp_path), replay=True)
+        assert [replay.respond("http://roku", "test_two", "POST /locate")[2] for _ in range(4)] == [b'"first"', b'"second"', b'"second"', b'"second"']
+        assert replay.respond("http://roku", "test_two", "POST /page_source")[2] == b'"Big Hits"'
+        assert replay.respond("http://roku", "test_two", "GET /missing") is None
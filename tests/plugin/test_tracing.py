@@ -0,0 +1,58 @@
+import json
+
+from pytest_testtrakt.tracing import Tracer
+
+pytest_plugins = ["pytester"]
+
+FAILING_TEST = """
+from stubs import StubAutomator
+
+
+class StartRequest:
+
+    def __init__(self):
+        self.ip_address = "10.0.0.1"
+        self.roku_password = "hunter2"
+        self.remote_api_token = "SECRET-TOKEN"
+        self.google_credentials_path = "/home/ci/ocr-credentials.json"
+
+
+class Test_StubTests:
+
+    def test_fails(self, automator_pool):
+        automator_pool.acquire(StubAutomator, "http://localhost:9070", StartRequest()).get_page_source()
+        assert False
+"""
+
+
+class Test_Tracer:
+
+    def test_credentials_never_reach_reports_or_traces(self, pytester):
+        pytester.makepyfile(test_failing=FAILING_TEST)
+        result = pytester.runpytest("-p", "pytest_testtrakt.plugin", "--trace-export", "trace.json")
+        result.assert_outcomes(failed=1)
+        result.stdout.fnmatch_lines(["*automator trace*", '*start*ip_address*10.0.0.1*'])
+        trace = (pytester.path / "trace.json").read_text()
+        assert "10.0.0.1" in trace
+        for secret in ("hunter2", "SECRET-TOKEN", "ocr-credentials"):
+            assert secret not in result.stdout.str()
+            assert secret not in trace
+
+    def test_spans_record_call_results(self):
+        tracer = Tracer()
+        tracer.current_test = "test_one"
+        tracer.wrap(lambda *args: [1, 2], "locator.locate", {"device": "roku"})("request")
+        tracer.wrap(lambda: "<html>", "get_page_source", {"device": "roku"})()
+        assert [span["attributes"] for span in tracer.spans] == [
+            {"device": "roku", "arguments": "'request'", "matches": 2},
+            {"device": "roku", "arguments": "", "payload_size": 6},
+        ]
+        assert len(tracer.summary_lines("test_one")) == 2
+        assert tracer.summary_lines("test_two") == []
+
+    def test_exports_chrome_trace(self, tmp_path):
+        tracer = Tracer()
+        tracer.wrap(lambda: None, "quit", {"device": "roku"})()
+        tracer.export_chrome_trace(str(tmp_path / "trace.json"))
+        events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+        assert [(event["name"], event["ph"], event["args"]["device"]) for event in events] == [("quit", "X", "roku")]
@@ -2,6 +2,8 @@ import os
 from pathlib import Path
 from typing import List
 
+import pytest
+
 from src.lgautomator.lg_automator import LGAutomator
 from src.lgautomator.lg_start_request import LGStartRequest
 from src.common.locator_request import LocatorRequest
@@ -31,16 +33,16 @@ class Test_LGTests:
   
     lg_automator = None
 
-    def teardown_method(self):
-        if not self.lg_automator is None:
-            self.lg_automator.quit()
+    @pytest.fixture(autouse=True)
+    def use_automator_pool(self, automator_pool):
+        self.automator_pool = automator_pool
         
     def test_find_element_by_tesseract(self):
         # create a start request
         lg_start_request = LGStartRequest(self.LG_IP_ADDRESS).with_app_package(self.APP_URL).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_ip_camera(self.IP_CAMERA)
         
         # start the lg automator session
-        self.lg_automator = LGAutomator(self.LG_AUTOMATOR_ADDRESS, lg_start_request)
+        self.lg_automator = self.automator_pool.acquire(LGAutomator, self.LG_AUTOMATOR_ADDRESS, lg_start_request)
 
         # find an element by text on the screen
         elements: List[Element] = self.lg_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt Application Web Profiler Test Site").with_timeout(40000))
@@ -66,7 +68,7 @@ class Test_LGTests:
         lg_start_request = LGStartRequest(self.LG_IP_ADDRESS).with_app_package(self.APP_URL).with_google_vision_ocr(self.GOOGLE_VISION_OCR).with_web_profiler_id(self.WEB_PROFILER_ID).with_ip_camera(self.IP_CAMERA)
         
         # start the lg automator session
-        self.lg_automator = LGAutomator(self.LG_AUTOMATOR_ADDRESS, lg_start_request)
+        self.lg_automator = self.automator_pool.acquire(LGAutomator, self.LG_AUTOMATOR_ADDRESS, lg_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.lg_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").find_all(True).with_timeout(40000))
@@ -77,7 +79,7 @@ class Test_LGTests:
         lg_start_request = LGStartRequest(self.LG_IP_ADDRESS).with_app_package(self.APP_URL).with_amazon_textract_ocr(self.TEXTRACT_OCR).with_web_profiler_id(self.WEB_PROFILER_ID).with_ip_camera(self.IP_CAMERA)
         
         # start the lg automator session
-        self.lg_automator = LGAutomator(self.LG_AUTOMATOR_ADDRESS, lg_start_request)
+        self.lg_automator = self.automator_pool.acquire(LGAutomator, self.LG_AUTOMATOR_ADDRESS, lg_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.lg_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").find_all(True).with_timeout(40000))
@@ -88,7 +90,7 @@ class Test_LGTests:
         lg_start_request = LGStartRequest(self.LG_IP_ADDRESS).with_app_package(self.APP_URL).with_amazon_rekognition_ocr(self.TEXTRACT_OCR).with_web_profiler_id(self.WEB_PROFILER_ID).with_ip_camera(self.IP_CAMERA)
         
         # start the lg automator session
-        self.lg_automator = LGAutomator(self.LG_AUTOMATOR_ADDRESS, lg_start_request)
+        self.lg_automator = self.automator_pool.acquire(LGAutomator, self.LG_AUTOMATOR_ADDRESS, lg_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.lg_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").find_all(True).with_timeout(40000))
@@ -99,7 +101,7 @@ class Test_LGTests:
         lg_start_request = LGStartRequest(self.LG_IP_ADDRESS).with_app_package(self.APP_URL).with_web_profiler_id(self.WEB_PROFILER_ID).with_ip_camera(self.IP_CAMERA)
         
         # start the lg automator session
-        self.lg_automator = LGAutomator(self.LG_AUTOMATOR_ADDRESS, lg_start_request)
+        self.lg_automator = self.automator_pool.acquire(LGAutomator, self.LG_AUTOMATOR_ADDRESS, lg_start_request)
 
         # set a default image similarity
         self.lg_automator.options().set(OptionsRequest().set_default_controller_delay(.90))
@@ -116,7 +118,7 @@ class Test_LGTests:
         lg_start_request = LGStartRequest(self.LG_IP_ADDRESS).with_app_package(self.APP_URL).with_web_profiler_id(self.WEB_PROFILER_ID)
         
         # start the lg automator session
-        self.lg_automator = LGAutomator(self.LG_AUTOMATOR_ADDRESS, lg_start_request)
+        self.lg_automator = self.automator_pool.acquire(LGAutomator, self.LG_AUTOMATOR_ADDRESS, lg_start_request)
         
         # find an element by css
         elements: List[Element] = self.lg_automator.locator().locate(LocatorRequest(LocatorType.CSS, "span[id='testtraktidentifier']").with_timeout(40000))
@@ -151,7 +153,7 @@ class Test_LGTests:
         lg_start_request = LGStartRequest(self.LG_IP_ADDRESS).with_app_package(self.APP_URL).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID)
         
         # start the lg automator session
-        self.lg_automator = LGAutomator(self.LG_AUTOMATOR_ADDRESS, lg_start_request)
+        self.lg_automator = self.automator_pool.acquire(LGAutomator, self.LG_AUTOMATOR_ADDRESS, lg_start_request)
 
         # set a delay between remote interactions
         self.lg_automator.options().set(OptionsRequest().set_default_controller_delay(1000))
@@ -167,7 +169,7 @@ class Test_LGTests:
         lg_start_request = LGStartRequest(self.LG_IP_ADDRESS).with_app_package(self.APP_URL).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID)
         
         # start the lg automator session
-        self.lg_automator = LGAutomator(self.LG_AUTOMATOR_ADDRESS, lg_start_request)
+        self.lg_automator = self.automator_pool.acquire(LGAutomator, self.LG_AUTOMATOR_ADDRESS, lg_start_request)
         
         # get the page source
         page_source: str = self.lg_automator.web_profiler().get_page_source()
@@ -182,10 +184,10 @@ class Test_LGTests:
         lg_start_request = LGStartRequest(self.LG_IP_ADDRESS).with_app_package(self.APP_URL).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the lg automator session
-        self.lg_automator = LGAutomator(self.LG_AUTOMATOR_ADDRESS, lg_start_request)
+        self.lg_automator = self.automator_pool.acquire(LGAutomator, self.LG_AUTOMATOR_ADDRESS, lg_start_request)
 
         # find an element
-        self.lg_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
+        self.lg_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "TestTrakt"), 40000)
 
         # get the screen image and save to a file
         image = self.lg_automator.display().get_image()
@@ -212,10 +214,10 @@ class Test_LGTests:
         lg_start_request = LGStartRequest(self.LG_IP_ADDRESS).with_app_package("https://www.google.com").with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_ffmpeg(self.FFMPEG_BIN).with_ip_camera(self.IP_CAMERA)
         
         # start the lg automator session
-        self.lg_automator = LGAutomator(self.LG_AUTOMATOR_ADDRESS, lg_start_request)
+        self.lg_automator = self.automator_pool.acquire(LGAutomator, self.LG_AUTOMATOR_ADDRESS, lg_start_request)
 
         # find an element
-        self.lg_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "Google").with_timeout(20000))
+        self.lg_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "Google"), 20000)
 
         # get the screen image and save to a file using our ip camera with ONVIF
         image = self.lg_automator.display().get_image()
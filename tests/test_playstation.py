@@ -1,6 +1,8 @@
 import os
 from typing import List
 
+import pytest
+
 from src.playstationautomator.playstation_automator import PlaystationAutomator
 from src.playstationautomator.playstation_start_request import PlaystationStartRequest
 from src.common.locator_request import LocatorRequest
@@ -30,16 +32,16 @@ class Test_PlaystationTests:
 
     playstation_automator = None
 
-    def teardown_method(self):
-        if not self.playstation_automator is None:
-            self.playstation_automator.quit()
+    @pytest.fixture(autouse=True)
+    def use_automator_pool(self, automator_pool):
+        self.automator_pool = automator_pool
         
     def test_find_element_by_tesseract(self):
         # create a start request
         playstation_start_request = PlaystationStartRequest(self.PLAYSTATION_IP_ADDRESS).with_app_package(self.APP_PACKAGE, self.TITLE_ID).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE)
         
         # start the playstation automator session
-        self.playstation_automator = PlaystationAutomator(self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
+        self.playstation_automator = self.automator_pool.acquire(PlaystationAutomator, self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
 
         # find an element by text on the screen
         elements: List[Element] = self.playstation_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "LOCATOR_TEXT_TO_FIND").with_timeout(40000))
@@ -61,7 +63,7 @@ class Test_PlaystationTests:
         playstation_start_request = PlaystationStartRequest(self.PLAYSTATION_IP_ADDRESS).with_app_package(self.APP_PACKAGE, self.TITLE_ID).with_google_vision_ocr(self.GOOGLE_VISION_OCR)
         
         # start the playstation automator session
-        self.playstation_automator = PlaystationAutomator(self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
+        self.playstation_automator = self.automator_pool.acquire(PlaystationAutomator, self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
 
         # find element matches
         elements: List[Element] = self.playstation_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "LOCATOR_TEXT_TO_FIND").find_all(True).with_timeout(40000))
@@ -72,7 +74,7 @@ class Test_PlaystationTests:
         playstation_start_request = PlaystationStartRequest(self.PLAYSTATION_IP_ADDRESS).with_app_package(self.APP_PACKAGE, self.TITLE_ID).with_amazon_textract_ocr(self.TEXTRACT_OCR)
         
         # start the playstation automator session
-        self.playstation_automator = PlaystationAutomator(self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
+        self.playstation_automator = self.automator_pool.acquire(PlaystationAutomator, self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
 
         # find element matches
         elements: List[Element] = self.playstation_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "LOCATOR_TEXT_TO_FIND").with_timeout(40000))
@@ -82,7 +84,7 @@ class Test_PlaystationTests:
         playstation_start_request = PlaystationStartRequest(self.PLAYSTATION_IP_ADDRESS).with_app_package(self.APP_PACKAGE, self.TITLE_ID).with_amazon_rekognition_ocr(self.TEXTRACT_OCR)
         
         # start the playstation automator session
-        self.playstation_automator = PlaystationAutomator(self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
+        self.playstation_automator = self.automator_pool.acquire(PlaystationAutomator, self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
 
         # find the element
         elements: List[Element] = self.playstation_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "LOCATOR_TEXT_TO_FIND").with_timeout(40000))
@@ -92,7 +94,7 @@ class Test_PlaystationTests:
         playstation_start_request = PlaystationStartRequest(self.PLAYSTATION_IP_ADDRESS).with_app_package(self.APP_PACKAGE, self.TITLE_ID)
         
         # start the playstation automator session
-        self.playstation_automator = PlaystationAutomator(self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
+        self.playstation_automator = self.automator_pool.acquire(PlaystationAutomator, self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
 
         # set a default image similarity
         self.playstation_automator.options().set(OptionsRequest().set_default_controller_delay(.90))
@@ -109,7 +111,7 @@ class Test_PlaystationTests:
         playstation_start_request = PlaystationStartRequest(self.PLAYSTATION_IP_ADDRESS).with_app_package(self.APP_PACKAGE, self.TITLE_ID).with_web_profiler_id(self.WEB_PROFILER_ID)
         
         # start the playstation automator session
-        self.playstation_automator = PlaystationAutomator(self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
+        self.playstation_automator = self.automator_pool.acquire(PlaystationAutomator, self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
 
         # find an element by css
         elements: List[Element] = self.playstation_automator.locator().locate(LocatorRequest(LocatorType.CSS, "p[id='testtraktidentifier']").with_timeout(40000))
@@ -141,7 +143,7 @@ class Test_PlaystationTests:
         playstation_start_request = PlaystationStartRequest(self.PLAYSTATION_IP_ADDRESS).with_app_package(self.APP_PACKAGE, self.TITLE_ID).with_web_profiler_id(self.WEB_PROFILER_ID)
         
         # start the playstation automator session
-        self.playstation_automator = PlaystationAutomator(self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
+        self.playstation_automator = self.automator_pool.acquire(PlaystationAutomator, self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
 
         # find an element by xpath
         elements: List[Element] = self.playstation_automator.locator().locate(LocatorRequest(LocatorType.XPATH, "//p[@id='testtraktidentifier']").with_timeout(40000))
@@ -173,7 +175,7 @@ class Test_PlaystationTests:
         playstation_start_request = PlaystationStartRequest(self.PLAYSTATION_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the playstation automator session
-        self.playstation_automator = PlaystationAutomator(self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
+        self.playstation_automator = self.automator_pool.acquire(PlaystationAutomator, self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
 
         # find an element
         elements: List[Element] = self.playstation_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
@@ -192,10 +194,10 @@ class Test_PlaystationTests:
         playstation_start_request = PlaystationStartRequest(self.PLAYSTATION_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the playstation automator session
-        self.playstation_automator = PlaystationAutomator(self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
+        self.playstation_automator = self.automator_pool.acquire(PlaystationAutomator, self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
 
         # find an element
-        self.playstation_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
+        self.playstation_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "TestTrakt"), 40000)
         
         # get the page source
         page_source: str = self.playstation_automator.web_profiler().get_page_source()
@@ -214,10 +216,10 @@ class Test_PlaystationTests:
         playstation_start_request = PlaystationStartRequest(self.PLAYSTATION_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the playstation automator session
-        self.playstation_automator = PlaystationAutomator(self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
+        self.playstation_automator = self.automator_pool.acquire(PlaystationAutomator, self.PLAYSTATION_AUTOMATOR_ADDRESS, playstation_start_request)
 
         # find an element
-        self.playstation_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
+        self.playstation_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "TestTrakt"), 40000)
 
         # get the screen image and save to a file
         image = self.playstation_automator.display().get_image()
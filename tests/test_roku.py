@@ -3,6 +3,8 @@ import time
 from pathlib import Path
 from typing import List
 
+import pytest
+
 from src.rokuautomator.roku_automator import RokuAutomator
 from src.rokuautomator.roku_start_request import RokuStartRequest
 from src.common.locator_request import LocatorRequest
@@ -35,16 +37,16 @@ class Test_RokuTests:
 
     roku_automator = None
 
-    def teardown_method(self):
-        if not self.roku_automator is None:
-            self.roku_automator.quit()
+    @pytest.fixture(autouse=True)
+    def use_automator_pool(self, automator_pool):
+        self.automator_pool = automator_pool
         
     def test_find_element_by_ocr(self):
         # create a start request with an app package (channel) .zip
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # find an element by text on the screen
         elements: List[Element] = self.roku_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "roku").with_timeout(10000))
@@ -61,7 +63,7 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # find all roku elements by tag name
         elements: List[Element] = self.roku_automator.locator().locate(RokuLocatorRequest(RokuLocatorType.TAG, "RowListItem").find_all(True).with_timeout(10000))
@@ -105,7 +107,7 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # get the application page source
         page_source: str = self.roku_automator.get_page_source();
@@ -116,7 +118,7 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # get the roku media player data
         roku_media_player_data: RokuMediaPlayerData = self.roku_automator.get_media_player_data()
@@ -127,10 +129,10 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # wait for an element
-        self.roku_automator.locator().locate(RokuLocatorRequest(RokuLocatorType.XPATH, "//RowListItem").find_all(True).with_timeout(10000))
+        self.roku_automator.locator().wait_for(RokuLocatorRequest(RokuLocatorType.XPATH, "//RowListItem").find_all(True), 10000)
 
         # set a default button interact delay
         self.roku_automator.options().set(OptionsRequest().set_default_controller_delay(1000))
@@ -145,10 +147,10 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # wait for an element
-        self.roku_automator.locator().locate(RokuLocatorRequest(RokuLocatorType.XPATH, "//RowListItem").find_all(True).with_timeout(10000))
+        self.roku_automator.locator().wait_for(RokuLocatorRequest(RokuLocatorType.XPATH, "//RowListItem").find_all(True), 10000)
 
         # get the screen image and save to a file
         image = self.roku_automator.display().get_image()
@@ -175,7 +177,7 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # get the console logs
         console_logs = self.roku_automator.system().get_console_logs()
@@ -186,20 +188,20 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # background the app for a duration in milliseconds and then resume
         self.roku_automator.run_app_in_background(5000)
 
         # wait for an element
-        self.roku_automator.locator().locate(RokuLocatorRequest(RokuLocatorType.XPATH, "//RowListItem").with_timeout(10000))
+        self.roku_automator.locator().wait_for(RokuLocatorRequest(RokuLocatorType.XPATH, "//RowListItem"), 10000)
 
     def test_get_performance_data(self):
         # create a start request with an app package (channel) .zip
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE).with_performance_profiling_enabled(True)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # get the performance data - can be used with the roku brightscript visual profiler tool to evaluate cpu and memory usage - https://developer.roku.com/en-ca/docs/developer-program/dev-tools/brightscript-profiler.md
         performanceFile = self.roku_automator.get_performance_data();
@@ -210,10 +212,10 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE).with_hdmi_encoder(self.ENCODER_URL).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # wait for an element
-        self.roku_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "roku").find_all(True).with_timeout(10000))
+        self.roku_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "roku").find_all(True), 10000)
 
         # get the screen image and save to a file
         image = self.roku_automator.display().get_image()
@@ -240,7 +242,7 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # get the system information from the roku
         roku_system_information: RokuSystemInformation = self.roku_automator.system().get_system_info()
@@ -251,7 +253,7 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE)
         
         # start the roku automator session
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # get the current active/focused element
         active_element: Element = self.roku_automator.get_active_element()
@@ -262,20 +264,20 @@ class Test_RokuTests:
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE).with_deep_link("contentID", "mediaType")
         
         # start the roku automator session and deep link to our content
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # wait for element
-        self.roku_automator.locator().locate(RokuLocatorRequest(RokuLocatorType.XPATH, "//RowListItem").with_timeout(10000))
+        self.roku_automator.locator().wait_for(RokuLocatorRequest(RokuLocatorType.XPATH, "//RowListItem"), 10000)
 
     def test_proxy(self):
         # create a start request with an app package (channel) .zip with a deep link
         roku_start_request = RokuStartRequest(self.ROKU_IP_ADDRESS, self.ROKU_USERNAME, self.ROKU_PASSWORD).with_app_package(self.APP_PACKAGE).with_proxy("192.168.1.85", 8888)
         
         # start the roku automator session and deep link to our content
-        self.roku_automator = RokuAutomator(self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
+        self.roku_automator = self.automator_pool.acquire(RokuAutomator, self.ROKU_AUTOMATOR_ADDRESS, roku_start_request)
 
         # wait for element
-        self.roku_automator.locator().locate(RokuLocatorRequest(RokuLocatorType.XPATH, "//RowListItem").with_timeout(10000))
+        self.roku_automator.locator().wait_for(RokuLocatorRequest(RokuLocatorType.XPATH, "//RowListItem"), 10000)
 
     def verify_element_details(self, element, confidence, x, y, width, height):
         print("Element: " + str(element.get_element_data()))
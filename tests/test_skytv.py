@@ -3,6 +3,8 @@ import time
 from pathlib import Path
 from typing import List
 
+import pytest
+
 from src.skytvautomator.sky_tv_automator import SkyTVAutomator
 from src.skytvautomator.sky_tv_start_request import SkyTVStartRequest
 from src.common.locator_request import LocatorRequest
@@ -31,16 +33,16 @@ class Test_SkyTVTests:
 
     sky_tv_automator = None
 
-    def teardown_method(self):
-        if not self.sky_tv_automator is None:
-            self.sky_tv_automator.quit()
+    @pytest.fixture(autouse=True)
+    def use_automator_pool(self, automator_pool):
+        self.automator_pool = automator_pool
         
     def test_find_element_by_tesseract(self):
         # create a start request with the app id of your app to launch
         sky_tv_start_request = SkyTVStartRequest(self.SKY_TV_IP_ADDRESS).with_app_id(self.APP_ID).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_ffmpeg(self.FFMPEG_BIN).with_hdmi_encoder(self.ENCODER_URL)
         
         # start the sky tv automator session
-        self.sky_tv_automator = SkyTVAutomator(self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
+        self.sky_tv_automator = self.automator_pool.acquire(SkyTVAutomator, self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
 
         # find an element by text on the screen
         elements: List[Element] = self.sky_tv_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "recommended").with_timeout(40000))
@@ -66,7 +68,7 @@ class Test_SkyTVTests:
         sky_tv_start_request = SkyTVStartRequest(self.SKY_TV_IP_ADDRESS).with_app_id(self.APP_ID).with_google_vision_ocr(self.GOOGLE_VISION_OCR).with_ffmpeg(self.FFMPEG_BIN).with_hdmi_encoder(self.ENCODER_URL)
         
         # start the sky tv automator session
-        self.sky_tv_automator = SkyTVAutomator(self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
+        self.sky_tv_automator = self.automator_pool.acquire(SkyTVAutomator, self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.sky_tv_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "text to find").find_all(True).with_timeout(40000))
@@ -77,7 +79,7 @@ class Test_SkyTVTests:
         sky_tv_start_request = SkyTVStartRequest(self.SKY_TV_IP_ADDRESS).with_app_id(self.APP_ID).with_amazon_textract_ocr(self.TEXTRACT_OCR).with_ffmpeg(self.FFMPEG_BIN).with_hdmi_encoder(self.ENCODER_URL)
         
         # start the sky tv automator session
-        self.sky_tv_automator = SkyTVAutomator(self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
+        self.sky_tv_automator = self.automator_pool.acquire(SkyTVAutomator, self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.sky_tv_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "text to find").find_all(True).with_timeout(40000))
@@ -88,7 +90,7 @@ class Test_SkyTVTests:
         sky_tv_start_request = SkyTVStartRequest(self.SKY_TV_IP_ADDRESS).with_app_id(self.APP_ID).with_amazon_rekognition_ocr(self.TEXTRACT_OCR).with_ffmpeg(self.FFMPEG_BIN).with_hdmi_encoder(self.ENCODER_URL)
         
         # start the sky tv automator session
-        self.sky_tv_automator = SkyTVAutomator(self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
+        self.sky_tv_automator = self.automator_pool.acquire(SkyTVAutomator, self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.sky_tv_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "text to find").find_all(True).with_timeout(40000))
@@ -99,7 +101,7 @@ class Test_SkyTVTests:
         sky_tv_start_request = SkyTVStartRequest(self.SKY_TV_IP_ADDRESS).with_app_id(self.APP_ID).with_ffmpeg(self.FFMPEG_BIN).with_hdmi_encoder(self.ENCODER_URL)
         
         # start the sky tv automator session
-        self.sky_tv_automator = SkyTVAutomator(self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
+        self.sky_tv_automator = self.automator_pool.acquire(SkyTVAutomator, self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
 
         # set a default image similarity
         self.sky_tv_automator.options().set(OptionsRequest().set_default_image_find_similarity(.90))
@@ -116,7 +118,7 @@ class Test_SkyTVTests:
         sky_tv_start_request = SkyTVStartRequest(self.SKY_TV_IP_ADDRESS).with_app_id(self.APP_ID).with_web_profiler_id(self.WEB_PROFILER_ID)
         
         # start the sky tv automator session
-        self.sky_tv_automator = SkyTVAutomator(self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
+        self.sky_tv_automator = self.automator_pool.acquire(SkyTVAutomator, self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
 
         # find an element by css
         elements: List[Element] = self.sky_tv_automator.locator().locate(LocatorRequest(LocatorType.CSS, "div[class='featured-title']").with_timeout(40000))
@@ -148,7 +150,7 @@ class Test_SkyTVTests:
         sky_tv_start_request = SkyTVStartRequest(self.SKY_TV_IP_ADDRESS).with_app_id(self.APP_ID).with_web_profiler_id(self.WEB_PROFILER_ID).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE)
         
         # start the sky tv automator session
-        self.sky_tv_automator = SkyTVAutomator(self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
+        self.sky_tv_automator = self.automator_pool.acquire(SkyTVAutomator, self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
 
         # find an element by xpath
         elements: List[Element] = self.sky_tv_automator.locator().locate(LocatorRequest(LocatorType.XPATH, "//div[@class='featured-title']").with_timeout(40000))
@@ -180,7 +182,7 @@ class Test_SkyTVTests:
         sky_tv_start_request = SkyTVStartRequest(self.SKY_TV_IP_ADDRESS).with_app_id(self.APP_ID).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_ffmpeg(self.FFMPEG_BIN).with_hdmi_encoder(self.ENCODER_URL)
         
         # start the sky tv automator session
-        self.sky_tv_automator = SkyTVAutomator(self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
+        self.sky_tv_automator = self.automator_pool.acquire(SkyTVAutomator, self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
 
         # find an element
         elements: List[Element] = self.sky_tv_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "Recommended").with_timeout(40000))
@@ -198,10 +200,10 @@ class Test_SkyTVTests:
         sky_tv_start_request = SkyTVStartRequest(self.SKY_TV_IP_ADDRESS).with_app_id(self.APP_ID).with_web_profiler_id(self.WEB_PROFILER_ID).with_hdmi_encoder(self.ENCODER_URL)
         
         # start the sky tv automator session
-        self.sky_tv_automator = SkyTVAutomator(self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
+        self.sky_tv_automator = self.automator_pool.acquire(SkyTVAutomator, self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
 
         # find an element
-        self.sky_tv_automator.locator().locate(LocatorRequest(LocatorType.CSS, "div[class='featured-title']").with_timeout(40000))
+        self.sky_tv_automator.locator().wait_for(LocatorRequest(LocatorType.CSS, "div[class='featured-title']"), 40000)
         
         # get the page source
         page_source: str = self.sky_tv_automator.web_profiler().get_page_source()
@@ -220,10 +222,10 @@ class Test_SkyTVTests:
         sky_tv_start_request = SkyTVStartRequest(self.SKY_TV_IP_ADDRESS).with_app_id(self.APP_ID).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_ffmpeg(self.FFMPEG_BIN).with_hdmi_encoder(self.ENCODER_URL)
         
         # start the sky tv automator session
-        self.sky_tv_automator = SkyTVAutomator(self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
+        self.sky_tv_automator = self.automator_pool.acquire(SkyTVAutomator, self.SKY_TV_AUTOMATOR_ADDRESS, sky_tv_start_request)
 
         # find an element
-        self.sky_tv_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "Recommended").with_timeout(40000))
+        self.sky_tv_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "Recommended"), 40000)
 
         # get the screen image and save to a file
         image = self.sky_tv_automator.display().get_image()
@@ -1,6 +1,8 @@
 import os
 from typing import List
 
+import pytest
+
 from src.tizenautomator.tizen_automator import TizenAutomator
 from src.tizenautomator.tizen_start_request import TizenStartRequest
 from src.common.locator_request import LocatorRequest
@@ -30,16 +32,16 @@ class Test_TizenTests:
 
     tizen_automator = None
 
-    def teardown_method(self):
-        if not self.tizen_automator is None:
-            self.tizen_automator.quit()
+    @pytest.fixture(autouse=True)
+    def use_automator_pool(self, automator_pool):
+        self.automator_pool = automator_pool
         
     def test_find_element_by_tesseract(self):
         # create a start request
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find an element by text on the screen
         elements: List[Element] = self.tizen_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt Application Web Profiler Test Site").with_timeout(40000))
@@ -65,7 +67,7 @@ class Test_TizenTests:
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_google_vision_ocr(self.GOOGLE_VISION_OCR).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.tizen_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").find_all(True).with_timeout(40000))
@@ -76,7 +78,7 @@ class Test_TizenTests:
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_amazon_textract_ocr(self.TEXTRACT_OCR).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.tizen_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").find_all(True).with_timeout(40000))
@@ -87,7 +89,7 @@ class Test_TizenTests:
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_amazon_rekognition_ocr(self.TEXTRACT_OCR).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.tizen_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").find_all(True).with_timeout(40000))
@@ -98,7 +100,7 @@ class Test_TizenTests:
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # set a default image similarity
         self.tizen_automator.options().set(OptionsRequest().set_default_controller_delay(.90))
@@ -115,7 +117,7 @@ class Test_TizenTests:
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find an element by css
         elements: List[Element] = self.tizen_automator.locator().locate(LocatorRequest(LocatorType.CSS, "p[id='testtraktidentifier']").with_timeout(40000))
@@ -147,7 +149,7 @@ class Test_TizenTests:
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find an element by xpath
         elements: List[Element] = self.tizen_automator.locator().locate(LocatorRequest(LocatorType.XPATH, "//p[@id='testtraktidentifier']").with_timeout(40000))
@@ -179,7 +181,7 @@ class Test_TizenTests:
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find an element
         elements: List[Element] = self.tizen_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
@@ -198,10 +200,10 @@ class Test_TizenTests:
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find an element
-        self.tizen_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
+        self.tizen_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "TestTrakt"), 40000)
         
         # get the page source
         page_source: str = self.tizen_automator.web_profiler().get_page_source()
@@ -220,10 +222,10 @@ class Test_TizenTests:
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find an element
-        self.tizen_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
+        self.tizen_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "TestTrakt"), 40000)
 
         # get the screen image and save to a file
         image = self.tizen_automator.display().get_image()
@@ -250,10 +252,10 @@ class Test_TizenTests:
         tizen_start_request = TizenStartRequest(self.TIZEN_IP_ADDRESS).with_app_package(self.APP_PACKAGE).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN).with_ffmpeg(self.FFMPEG_BIN).with_profile("TestTraktCustomCertificateProfile")
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find an element
-        self.tizen_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
+        self.tizen_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "TestTrakt"), 40000)
 
     def test_tizen_and_sdb_binary_location(self):
         # create a start request
@@ -261,7 +263,7 @@ class Test_TizenTests:
 
         
         # start the tizen automator session
-        self.tizen_automator = TizenAutomator(self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
+        self.tizen_automator = self.automator_pool.acquire(TizenAutomator, self.TIZEN_AUTOMATOR_ADDRESS, tizen_start_request)
 
         # find an element
-        self.tizen_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
+        self.tizen_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "TestTrakt"), 40000)
@@ -3,6 +3,8 @@ import time
 from pathlib import Path
 from typing import List
 
+import pytest
+
 from src.vizioautomator.vizio_automator import VizioAutomator
 from src.vizioautomator.vizio_start_request import VizioStartRequest
 from src.common.locator_request import LocatorRequest
@@ -32,16 +34,16 @@ class Test_VizioTests:
 
     vizio_automator = None
 
-    def teardown_method(self):
-        if not self.vizio_automator is None:
-            self.vizio_automator.quit()
+    @pytest.fixture(autouse=True)
+    def use_automator_pool(self, automator_pool):
+        self.automator_pool = automator_pool
         
     def test_find_element_by_tesseract(self):
         # create a start request
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # find an element by text on the screen
         elements: List[Element] = self.vizio_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt Application Web Profiler Test Site").with_timeout(40000))
@@ -67,7 +69,7 @@ class Test_VizioTests:
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_google_vision_ocr(self.GOOGLE_VISION_OCR).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.vizio_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").find_all(True).with_timeout(40000))
@@ -78,7 +80,7 @@ class Test_VizioTests:
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_amazon_textract_ocr(self.TEXTRACT_OCR).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.vizio_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").find_all(True).with_timeout(40000))
@@ -89,7 +91,7 @@ class Test_VizioTests:
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_amazon_rekognition_ocr(self.TEXTRACT_OCR).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.vizio_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").find_all(True).with_timeout(40000))
@@ -100,7 +102,7 @@ class Test_VizioTests:
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # set a default image similarity
         self.vizio_automator.options().set(OptionsRequest().set_default_controller_delay(.90))
@@ -117,7 +119,7 @@ class Test_VizioTests:
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # find an element by css
         elements: List[Element] = self.vizio_automator.locator().locate(LocatorRequest(LocatorType.CSS, "span[id='testtraktidentifier']").with_timeout(40000))
@@ -149,7 +151,7 @@ class Test_VizioTests:
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # find an element by xpath
         elements: List[Element] = self.vizio_automator.locator().locate(LocatorRequest(LocatorType.XPATH, "//span[@id='testtraktidentifier']").with_timeout(40000))
@@ -181,7 +183,7 @@ class Test_VizioTests:
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # find an element
         elements: List[Element] = self.vizio_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
@@ -200,10 +202,10 @@ class Test_VizioTests:
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # find an element
-        self.vizio_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
+        self.vizio_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "TestTrakt"), 40000)
         
         # get the page source
         page_source: str = self.vizio_automator.web_profiler().get_page_source()
@@ -222,10 +224,10 @@ class Test_VizioTests:
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # find an element
-        self.vizio_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
+        self.vizio_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "TestTrakt"), 40000)
         
         # get the system information
         vizio_system_information: VizioSystemInformation = self.vizio_automator.system().get_system_info()
@@ -236,10 +238,10 @@ class Test_VizioTests:
         vizio_start_request = VizioStartRequest(self.VIZIO_IP_ADDRESS).with_app_url(self.APP_URL).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_web_profiler_id(self.WEB_PROFILER_ID).with_remote_api_token(self.REMOTE_API_TOKEN).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the vizio automator session
-        self.vizio_automator = VizioAutomator(self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
+        self.vizio_automator = self.automator_pool.acquire(VizioAutomator, self.VIZIO_AUTOMATOR_ADDRESS, vizio_start_request)
 
         # find an element
-        self.vizio_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "TestTrakt").with_timeout(40000))
+        self.vizio_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "TestTrakt"), 40000)
 
         # get the screen image and save to a file
         image = self.vizio_automator.display().get_image()
@@ -3,6 +3,8 @@ import time
 from pathlib import Path
 from typing import List
 
+import pytest
+
 from src.xboxautomator.xbox_automator import XBoxAutomator
 from src.xboxautomator.xbox_start_request import XBoxStartRequest
 from src.common.locator_request import LocatorRequest
@@ -32,16 +34,16 @@ class Test_XBoxTests:
 
     xbox_automator = None
 
-    def teardown_method(self):
-        if not self.xbox_automator is None:
-            self.xbox_automator.quit()
+    @pytest.fixture(autouse=True)
+    def use_automator_pool(self, automator_pool):
+        self.automator_pool = automator_pool
         
     def test_find_element_by_tesseract(self):
         # create a start request with an app package that is a public url to a .appx or .appxbundle
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # find an element by text on the screen
         elements: List[Element] = self.xbox_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "locator_text_to_find").with_timeout(40000))
@@ -67,7 +69,7 @@ class Test_XBoxTests:
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME).with_google_vision_ocr(self.GOOGLE_VISION_OCR).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.xbox_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "locator_text_to_find").find_all(True).with_timeout(40000))
@@ -78,7 +80,7 @@ class Test_XBoxTests:
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME).with_amazon_textract_ocr(self.TEXTRACT_OCR).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.xbox_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "locator_text_to_find").find_all(True).with_timeout(40000))
@@ -89,7 +91,7 @@ class Test_XBoxTests:
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME).with_amazon_rekognition_ocr(self.TEXTRACT_OCR).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # find multiple element matches
         elements: List[Element] = self.xbox_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "locator_text_to_find").find_all(True).with_timeout(40000))
@@ -100,7 +102,7 @@ class Test_XBoxTests:
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # set a default image similarity
         self.xbox_automator.options().set(OptionsRequest().set_default_controller_delay(.90))
@@ -117,7 +119,7 @@ class Test_XBoxTests:
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME).with_web_profiler_id(self.WEB_PROFILER_ID)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # find an element by css
         elements: List[Element] = self.xbox_automator.locator().locate(LocatorRequest(LocatorType.CSS, "div[class='locator-class']").with_timeout(40000))
@@ -149,7 +151,7 @@ class Test_XBoxTests:
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME).with_web_profiler_id(self.WEB_PROFILER_ID).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         #self.xbox_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "locator_text_to_find").with_timeout(40000))
         
@@ -183,7 +185,7 @@ class Test_XBoxTests:
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # find an element
         elements: List[Element] = self.xbox_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "locator_text_to_find").with_timeout(40000))
@@ -197,17 +199,17 @@ class Test_XBoxTests:
         self.xbox_automator.controller().send_command(XBoxControllerPress(XBoxControllerButton.DOWN_ARROW))
         self.xbox_automator.controller().send_command(XBoxControllerPress(XBoxControllerButton.A))
 
-        self.xbox_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "locator_text_to_find").with_timeout(15000))
+        self.xbox_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "locator_text_to_find"), 15000)
 
     def test_web_profiler(self):
         # create a start request with an app package that is a public url to a .appx or .appxbundle
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME).with_web_profiler_id(self.WEB_PROFILER_ID)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # find an element
-        self.xbox_automator.locator().locate(LocatorRequest(LocatorType.CSS, "div[class='locator-class']").with_timeout(40000))
+        self.xbox_automator.locator().wait_for(LocatorRequest(LocatorType.CSS, "div[class='locator-class']"), 40000)
         
         # get the page source
         page_source: str = self.xbox_automator.web_profiler().get_page_source()
@@ -226,10 +228,10 @@ class Test_XBoxTests:
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # find an element
-        self.xbox_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "locator_text_to_find").with_timeout(40000))
+        self.xbox_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "locator_text_to_find"), 40000)
         
         # get the system information
         xbox_system_information: XBoxSystemInformation = self.xbox_automator.system().get_system_info()
@@ -240,20 +242,20 @@ class Test_XBoxTests:
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_name(self.APP_NAME).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # find an element
-        self.xbox_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "locator_text_to_find").with_timeout(40000))
+        self.xbox_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "locator_text_to_find"), 40000)
 
     def test_screen_artifacts(self):
         # create a start request with an app that is already installed
         xbox_start_request = XBoxStartRequest(self.XBOX_IP_ADDRESS).with_app_package(self.APP_URL).with_app_name(self.APP_NAME).with_tesseract_ocr(self.TESSERACT_BIN, self.TESSERACT_DATA_DIR, self.TESSERACT_LANGUAGE).with_ffmpeg(self.FFMPEG_BIN)
         
         # start the xbox automator session
-        self.xbox_automator = XBoxAutomator(self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
+        self.xbox_automator = self.automator_pool.acquire(XBoxAutomator, self.XBOX_AUTOMATOR_ADDRESS, xbox_start_request)
 
         # find an element
-        self.xbox_automator.locator().locate(LocatorRequest(LocatorType.TEXT, "locator_text_to_find").with_timeout(40000))
+        self.xbox_automator.locator().wait_for(LocatorRequest(LocatorType.TEXT, "locator_text_to_find"), 40000)
 
         # get the screen image and save to a file
         image = self.xbox_automator.display().get_image()